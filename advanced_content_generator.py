@@ -1,5 +1,10 @@
-from openai import OpenAI
+from openai import AsyncOpenAI
+import asyncio
+import base64
 import json
+import logging
+import requests
+import weakref
 from typing import Dict, List, Any
 from datetime import datetime
 from dataclasses import dataclass
@@ -24,74 +29,98 @@ class ReportConfig:
     brand_colors: Dict[str, str]
     logo_path: str = None
 
+logger = logging.getLogger(__name__)
+
+# One client (and connection pool) per API key and event loop, shared across generator
+# instances; the pool is bound to the loop that opened it, and the entry goes with the loop
+_openai_clients = weakref.WeakKeyDictionary()
+
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared OpenAI client for the given API key on the running event loop"""
+    clients = _openai_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = AsyncOpenAI(api_key=api_key)
+    return client
+
+# Static section guidance shared by every generator instance
+_CONTENT_TEMPLATES = {
+    "executive_summary": """
+    Create a compelling executive summary that:
+    1. Opens with the most critical finding
+    2. Presents 3-5 key insights with supporting data
+    3. Quantifies business impact where possible
+    4. Ends with clear, actionable recommendations
+    5. Uses language appropriate for C-suite audience
+    6. Stays within 500-750 words
+    """,
+    "methodology": """
+    Describe the research methodology with:
+    1. Data collection methods and sources
+    2. Sample sizes and selection criteria
+    3. Analysis techniques employed
+    4. Quality assurance measures
+    5. Limitations and potential biases
+    6. Confidence levels and margins of error
+    """,
+    "market_analysis": """
+    Provide comprehensive market analysis including:
+    1. Market size and growth projections
+    2. Key market drivers and barriers
+    3. Competitive landscape analysis
+    4. Consumer behavior insights
+    5. Technology trends and disruptions
+    6. Regulatory environment impact
+    """,
+    "recommendations": """
+    Develop strategic recommendations that are:
+    1. Specific and actionable
+    2. Prioritized by impact and feasibility
+    3. Include implementation timelines
+    4. Address potential risks and mitigation
+    5. Quantify expected outcomes
+    6. Consider resource requirements
+    """
+}
+
 class AdvancedContentGenerator:
     """Advanced content generation with specialized prompts"""
     
     def __init__(self, api_key: str):
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
         self.content_templates = self._load_content_templates()
     
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client for the running event loop, so one generator can serve several asyncio.run calls"""
+        return _get_openai_client(self.api_key)
+    
     def _load_content_templates(self) -> Dict[str, str]:
         """Load specialized content templates"""
-        return {
-            "executive_summary": """
-            Create a compelling executive summary that:
-            1. Opens with the most critical finding
-            2. Presents 3-5 key insights with supporting data
-            3. Quantifies business impact where possible
-            4. Ends with clear, actionable recommendations
-            5. Uses language appropriate for C-suite audience
-            6. Stays within 500-750 words
-            """,
-            "methodology": """
-            Describe the research methodology with:
-            1. Data collection methods and sources
-            2. Sample sizes and selection criteria
-            3. Analysis techniques employed
-            4. Quality assurance measures
-            5. Limitations and potential biases
-            6. Confidence levels and margins of error
-            """,
-            "market_analysis": """
-            Provide comprehensive market analysis including:
-            1. Market size and growth projections
-            2. Key market drivers and barriers
-            3. Competitive landscape analysis
-            4. Consumer behavior insights
-            5. Technology trends and disruptions
-            6. Regulatory environment impact
-            """,
-            "recommendations": """
-            Develop strategic recommendations that are:
-            1. Specific and actionable
-            2. Prioritized by impact and feasibility
-            3. Include implementation timelines
-            4. Address potential risks and mitigation
-            5. Quantify expected outcomes
-            6. Consider resource requirements
-            """
-        }
+        return _CONTENT_TEMPLATES
     
     async def generate_comprehensive_report(self, research_data: Dict[str, Any], config: ReportConfig) -> Dict[str, Any]:
         """Generate complete report content"""
         
-        print("📝 Generating executive summary...")
-        executive_summary = await self.generate_executive_summary(research_data, config)
-        
-        print("📝 Generating methodology...")
-        methodology = await self.generate_methodology(research_data, config)
-        
-        print("📝 Generating key findings...")
-        key_findings = await self.generate_key_findings(research_data, config)
-        
-        print("📝 Generating detailed analysis...")
-        detailed_analysis = await self.generate_detailed_analysis(research_data, config)
-        
-        print("📝 Generating recommendations...")
-        recommendations = await self.generate_recommendations(research_data, config)
-        
-        print("📝 Generating appendices...")
-        appendices = await self.generate_appendices(research_data, config)
+        # Sections are independent of each other, so request them concurrently
+        logger.info("📝 Generating executive summary, methodology, key findings, detailed analysis, recommendations and appendices...")
+        (
+            executive_summary,
+            methodology,
+            key_findings,
+            detailed_analysis,
+            recommendations,
+            appendices,
+            data_tables
+        ) = await asyncio.gather(
+            self.generate_executive_summary(research_data, config),
+            self.generate_methodology(research_data, config),
+            self.generate_key_findings(research_data, config),
+            self.generate_detailed_analysis(research_data, config),
+            self.generate_recommendations(research_data, config),
+            self.generate_appendices(research_data, config),
+            self.generate_data_tables(research_data, config)
+        )
         
         return {
             "executive_summary": executive_summary,
@@ -100,7 +129,7 @@ class AdvancedContentGenerator:
             "detailed_analysis": detailed_analysis,
             "recommendations": recommendations,
             "appendices": appendices,
-            "data_tables": await self.generate_data_tables(research_data, config)
+            "data_tables": data_tables
         }
     
     async def generate_executive_summary(self, research_data: Dict[str, Any], config: ReportConfig) -> Dict[str, Any]:
@@ -124,28 +153,42 @@ class AdvancedContentGenerator:
         investment_data = []
         market_metrics = []
         verified_findings = []
+        sources_verified = 0
+        fact_checked = 0
         
         for source in primary_research:
+            get = source.get
+            
+            # Count data quality flags in the same pass
+            ai_validated = get('ai_validated')
+            if ai_validated:
+                sources_verified += 1
+            if get('verification_completed'):
+                fact_checked += 1
+            
             # Extract OpenAI-verified insights
-            if source.get('ai_validated') and source.get('openai_analysis'):
-                analysis = source.get('openai_analysis', {})
+            analysis = get('openai_analysis')
+            if analysis and ai_validated:
                 key_insights.extend(analysis.get('key_insights', []))
             
             # Extract investment data
-            if source.get('investment_data'):
-                investment_data.extend(source.get('investment_data', []))
+            investments = get('investment_data')
+            if investments:
+                investment_data.extend(investments)
             
             # Extract market analysis
-            if source.get('market_analysis'):
-                market_analysis = source.get('market_analysis', {})
-                if market_analysis.get('market_size'):
-                    market_metrics.append(f"Market Size: {market_analysis['market_size']}")
-                if market_analysis.get('growth_rate'):
-                    market_metrics.append(f"Growth Rate: {market_analysis['growth_rate']}")
+            market_analysis = get('market_analysis')
+            if market_analysis:
+                market_size = market_analysis.get('market_size')
+                if market_size:
+                    market_metrics.append(f"Market Size: {market_size}")
+                growth_rate = market_analysis.get('growth_rate')
+                if growth_rate:
+                    market_metrics.append(f"Growth Rate: {growth_rate}")
             
             # Extract verified findings
-            if source.get('fact_verification', {}).get('credibility_score', 0) >= 7:
-                verified_findings.extend(source.get('key_findings', []))
+            if get('fact_verification', {}).get('credibility_score', 0) >= 7:
+                verified_findings.extend(get('key_findings', []))
         
         user_prompt = f"""
         Create a comprehensive executive summary for: {config.title}
@@ -217,7 +260,7 @@ class AdvancedContentGenerator:
         Focus on actionable insights that drive business decisions.
         """
         
-        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.3)
+        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.3, max_tokens=2500)
         
         return {
             "content": response,
@@ -230,8 +273,8 @@ class AdvancedContentGenerator:
             },
             "competitive_summary": await self._extract_competitive_insights(research_data),
             "data_quality": {
-                "sources_verified": len([s for s in primary_research if s.get('ai_validated')]),
-                "fact_checked": len([s for s in primary_research if s.get('verification_completed')]),
+                "sources_verified": sources_verified,
+                "fact_checked": fact_checked,
                 "overall_quality": research_data.get('data_quality_score', 0)
             }
         }
@@ -293,7 +336,7 @@ class AdvancedContentGenerator:
         Use specific research terminology and include details about analytical rigor.
         """
         
-        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.2)
+        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.2, max_tokens=2500)
         
         return {
             "content": response,
@@ -385,7 +428,7 @@ class AdvancedContentGenerator:
         Use professional analytical language and demonstrate strategic thinking.
         """
         
-        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.3)
+        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.3, max_tokens=3500)
         
         return {
             "content": response,
@@ -575,7 +618,7 @@ class AdvancedContentGenerator:
         Include quantified benefits and ROI projections where possible.
         """
         
-        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.3)
+        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.3, max_tokens=3500)
         
         return {
             "content": response,
@@ -707,7 +750,7 @@ class AdvancedContentGenerator:
         Use specific data points, methodological details, and technical information that supports the main analysis.
         """
         
-        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.2)
+        response = await self._make_openai_request(system_prompt, user_prompt, temperature=0.2, max_tokens=2500)
         
         return {
             "content": response,
@@ -753,28 +796,25 @@ class AdvancedContentGenerator:
     
     async def _extract_market_metrics(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract market metrics from research data"""
-        metrics = {
-            "data_points_analyzed": 0,
-            "sources_consulted": len(research_data.get('primary_research', [])),
+        primary_research = research_data.get('primary_research', [])
+        
+        return {
+            "data_points_analyzed": sum(len(source.get('data_points', [])) for source in primary_research),
+            "sources_consulted": len(primary_research),
             "quality_score": research_data.get('data_quality_score', 0),
             "trend_indicators": len(research_data.get('trend_analysis', {}).get('growth_indicators', []))
         }
-        
-        # Count total data points
-        for source in research_data.get('primary_research', []):
-            metrics["data_points_analyzed"] += len(source.get('data_points', []))
-        
-        return metrics
     
     async def _extract_competitive_insights(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract competitive insights"""
         competitive_data = research_data.get('competitive_intelligence', {})
+        get = competitive_data.get
         
         return {
-            "competitors_identified": len(competitive_data.get('competitors', [])),
-            "market_positioning_data": bool(competitive_data.get('market_positioning')),
-            "pricing_analysis_available": bool(competitive_data.get('pricing_analysis')),
-            "product_comparison_data": bool(competitive_data.get('product_comparison'))
+            "competitors_identified": len(get('competitors', [])),
+            "market_positioning_data": bool(get('market_positioning')),
+            "pricing_analysis_available": bool(get('pricing_analysis')),
+            "product_comparison_data": bool(get('product_comparison'))
         }
     
     async def _generate_recommendations_preview(self, research_data: Dict[str, Any]) -> List[str]:
@@ -797,28 +837,28 @@ class AdvancedContentGenerator:
         
         return preview_recommendations[:3]
     
-    async def _make_openai_request(self, system_prompt: str, user_prompt: str, temperature: float = 0.3) -> str:
+    async def _make_openai_request(self, system_prompt: str, user_prompt: str, temperature: float = 0.3, max_tokens: int = 4000) -> str:
         """Make OpenAI API request with error handling"""
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4-turbo-preview",
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=temperature,
-                max_tokens=4000
+                max_tokens=max_tokens
             )
             return response.choices[0].message.content
         except Exception as e:
-            print(f"Error generating content: {e}")
+            logger.error("Error generating content: %s", e)
             return "Error generating content. Please try again."
 
     async def generate_report_image(self, prompt: str) -> str:
         """Generate AI image for the report using DALL-E"""
         try:
-            response = self.client.images.generate(
+            response = await self.client.images.generate(
                 model="dall-e-3",
                 prompt=prompt,
                 size="1024x1024",
@@ -826,20 +866,21 @@ class AdvancedContentGenerator:
                 n=1
             )
             
-            # Get the image URL and convert to base64
-            import requests
-            import base64
-            
+            # Download and base64-encode off the event loop so other
+            # image/LLM requests keep progressing meanwhile
             image_url = response.data[0].url
-            image_response = requests.get(image_url)
-            image_base64 = base64.b64encode(image_response.content).decode()
-            
-            return image_base64
+            return await asyncio.to_thread(self._download_image_base64, image_url)
             
         except Exception as e:
-            print(f"Error generating AI image: {e}")
+            logger.error("Error generating AI image: %s", e)
             return None
 
+    @staticmethod
+    def _download_image_base64(image_url: str) -> str:
+        """Fetch an image and return it base64-encoded (blocking)"""
+        image_response = requests.get(image_url)
+        return base64.b64encode(image_response.content).decode()
+
     async def _analyze_funding_trends(self, investment_data: List[Dict]) -> Dict[str, Any]:
         """Analyze funding trends from investment data"""
         if not investment_data:
@@ -851,16 +892,15 @@ class AdvancedContentGenerator:
         
         yearly_funding = defaultdict(list)
         round_types = defaultdict(int)
+        strptime = datetime.datetime.strptime
         
         for investment in investment_data:
             try:
                 date_str = investment.get('date', '')
                 if date_str:
-                    year = datetime.datetime.strptime(date_str, "%Y-%m-%d").year
-                    yearly_funding[year].append(investment)
+                    yearly_funding[strptime(date_str, "%Y-%m-%d").year].append(investment)
                 
-                round_type = investment.get('round_type', 'Unknown')
-                round_types[round_type] += 1
+                round_types[investment.get('round_type', 'Unknown')] += 1
             except:
                 continue
         
@@ -882,28 +922,38 @@ class AdvancedContentGenerator:
         }
         
         primary_research = research_data.get('primary_research', [])
+        market_sizes = market_data["market_size"]
+        growth_rates = market_data["growth_rates"]
+        key_players = market_data["key_players"]
+        technology_trends = market_data["technology_trends"]
+        regulatory_factors = market_data["regulatory_factors"]
         
         for source in primary_research:
+            get = source.get
+            
             # Extract market analysis
-            if source.get('market_analysis'):
-                analysis = source.get('market_analysis', {})
-                if analysis.get('market_size'):
-                    market_data["market_size"].append(analysis['market_size'])
-                if analysis.get('growth_rate'):
-                    market_data["growth_rates"].append(analysis['growth_rate'])
+            analysis = get('market_analysis')
+            if analysis:
+                market_size = analysis.get('market_size')
+                if market_size:
+                    market_sizes.append(market_size)
+                growth_rate = analysis.get('growth_rate')
+                if growth_rate:
+                    growth_rates.append(growth_rate)
             
             # Extract key players
-            if source.get('key_players'):
-                market_data["key_players"].extend(source.get('key_players', []))
+            players = get('key_players')
+            if players:
+                key_players.extend(players)
             
             # Extract technology trends
-            if source.get('technology_analysis'):
-                tech_analysis = source.get('technology_analysis', {})
-                market_data["technology_trends"].extend(tech_analysis.get('emerging_technologies', []))
+            tech_analysis = get('technology_analysis')
+            if tech_analysis:
+                technology_trends.extend(tech_analysis.get('emerging_technologies', []))
             
             # Extract regulatory information
-            if source.get('regulatory_analysis'):
-                reg_analysis = source.get('regulatory_analysis', {})
-                market_data["regulatory_factors"].extend(reg_analysis.get('key_regulations', []))
+            reg_analysis = get('regulatory_analysis')
+            if reg_analysis:
+                regulatory_factors.extend(reg_analysis.get('key_regulations', []))
         
         return market_data 
\ No newline at end of file
@@ -1,23 +1,113 @@
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import asyncio
 import base64
+import hashlib
+import logging
+from collections import Counter, OrderedDict
 from io import BytesIO
-from typing import Dict, List, Any, Optional
-import numpy as np
-from datetime import datetime, timedelta
-import json
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, List, Any, NamedTuple, Optional
 import os
+import threading
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Kaleido 0.2.x keeps one Chromium process alive per PlotlyScope; share it across
+# visualizers and serialize access since it talks to that process over one pipe
+_kaleido_scope = None
+_kaleido_lock = threading.Lock()
+
+def _get_kaleido_scope():
+    """Return the shared PlotlyScope, or None when kaleido has no scopes API"""
+    global _kaleido_scope
+    if _kaleido_scope is None:
+        try:
+            from kaleido.scopes.plotly import PlotlyScope
+            _kaleido_scope = PlotlyScope()
+        except ImportError:
+            # kaleido>=1.0 dropped scopes; fig.to_image manages its own browser
+            _kaleido_scope = False
+    return _kaleido_scope or None
+
+# Rendered images keyed by a hash of the figure JSON, so identical charts
+# (placeholders, retries, repeated reports) skip the Kaleido round trip
+_IMAGE_CACHE_SIZE = 128
+_image_cache = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+# Shared read-only stand-in for missing source metadata, so lookups don't allocate a dict per source
+_EMPTY = MappingProxyType({})
+
+def _meta(source: Dict[str, Any]):
+    """Return a source's metadata, or the shared empty mapping"""
+    return source.get("source_metadata") or _EMPTY
+
+class _SourceSummary(NamedTuple):
+    """Fields of a validated source that the dashboard charts read"""
+    category: str
+    discovery_method: str
+    quality_score: float
+
+def _summarize_sources(validated_data: List[Dict[str, Any]]) -> List[_SourceSummary]:
+    """Project validated sources onto the chart fields in one pass"""
+    summaries = []
+    for source in validated_data:
+        metadata = _meta(source)
+        summaries.append(_SourceSummary(
+            metadata.get("category", "unknown"),
+            metadata.get("discovery_method", "unknown"),
+            source.get("quality_score", 0.7)
+        ))
+    return summaries
+
+# Trend series longer than this are downsampled before plotting
+_TREND_MAX_POINTS = 500
+_TREND_TARGET_POINTS = 400
+
+def _lttb_indices(np, values, threshold: int):
+    """Pick indices with Largest-Triangle-Three-Buckets, keeping the visual shape of the series"""
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    x = np.arange(n, dtype=np.float64)
+    bucket_size = (n - 2) / (threshold - 2)
+    
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        # Average of the following bucket (or the final point for the last bucket)
+        if end < next_end:
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        areas = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(areas.argmax())
+        indices[i + 1] = selected
+    return indices
 
 class EnhancedDataVisualizer:
     """Advanced data visualization for research reports"""
     
     def __init__(self, brand_colors: Dict[str, str], chart_style: str = "plotly_white"):
+        self._load_plotting_modules()
         self.brand_colors = brand_colors
         self.chart_style = chart_style if chart_style in ['plotly', 'plotly_white', 'plotly_dark', 'ggplot2', 'seaborn', 'simple_white'] else 'plotly_white'
+        # SVG/PDF output can't be embedded by ReportLab, so only raster formats are allowed
+        self.image_format = os.getenv("CHART_FORMAT", "png").lower()
+        if self.image_format not in ('png', 'webp'):
+            self.image_format = 'png'
+        self.image_scale = float(os.getenv("CHART_SCALE", "2"))
         self.output_dir = "temp"
         os.makedirs(self.output_dir, exist_ok=True)
-        self.color_palette = [
+        # Tuple so per-chart palette slices don't build new lists
+        self.color_palette = (
             brand_colors.get("primary", "#1f4e79"),
             brand_colors.get("secondary", "#666666"),
             brand_colors.get("accent", "#e74c3c"),
@@ -26,47 +116,87 @@ class EnhancedDataVisualizer:
             "#9b59b6",
             "#34495e",
             "#e67e22"
-        ]
+        )
+        # Parse the palette once so charts can use translucent fills directly
+        self._rgb_palette = [self._parse_hex_color(color) for color in self.color_palette]
+        self._rgba_fill = [f"rgba({r},{g},{b},0.1)" for r, g, b in self._rgb_palette]
+        self._rgba_area = [f"rgba({r},{g},{b},0.3)" for r, g, b in self._rgb_palette]
+    
+    @classmethod
+    def _load_plotting_modules(cls):
+        """Import plotly and numpy on first use; plotly alone takes hundreds of ms to load"""
+        if hasattr(cls, "go"):
+            return
+        import numpy as np
+        import plotly.graph_objects as go
+        import plotly.io as pio
+        from plotly.subplots import make_subplots
+        try:
+            # Pin orjson for to_json(), which also feeds the image cache key
+            import orjson  # noqa: F401
+            pio.json.config.default_engine = "orjson"
+        except ImportError:
+            pass
+        cls.np = np
+        cls.make_subplots = staticmethod(make_subplots)
+        cls.go = go
+    
+    @staticmethod
+    def _parse_hex_color(hex_color: str) -> tuple:
+        """Convert hex color to an RGB tuple"""
+        try:
+            hex_color = hex_color.lstrip('#')
+            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        except (AttributeError, ValueError):
+            return (26, 54, 93)  # Default blue RGB
+    
+    # (visualization key, research_data key, chart method) for charts drawn only when their data exists
+    _CHART_SPECS = (
+        ("trend_analysis", "trend_data", "create_trend_analysis_chart"),
+        ("findings_summary", "findings_data", "create_findings_summary_chart"),
+        ("quality_metrics", "quality_metrics", "create_quality_metrics_chart"),
+        ("source_distribution", "source_analysis", "create_source_distribution_chart"),
+        ("competitive_landscape", "competitive_data", "create_competitive_landscape_chart"),
+        ("growth_indicators", "growth_indicators", "create_growth_indicators_chart")
+    )
+    
+    def _chart_tasks(self, research_data: Dict[str, Any]) -> List[tuple]:
+        """List (key, chart method, input) for every chart the research data supports"""
+        tasks = [("executive_dashboard", self.create_executive_dashboard, research_data)]
+        for key, data_key, method_name in self._CHART_SPECS:
+            data = research_data.get(data_key)
+            if data:
+                tasks.append((key, getattr(self, method_name), data))
+        return tasks
     
     def generate_all_visualizations(self, research_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate comprehensive visualization suite"""
+        return {key: create_chart(data) for key, create_chart, data in self._chart_tasks(research_data)}
+    
+    async def generate_all_visualizations_async(self, research_data: Dict[str, Any]) -> Dict[str, str]:
+        """Generate comprehensive visualization suite with charts rendered concurrently; failed charts are left out"""
         
-        visualizations = {}
-        
-        # Executive dashboard
-        visualizations["executive_dashboard"] = self.create_executive_dashboard(research_data)
-        
-        # Market trends analysis
-        if research_data.get("trend_data"):
-            visualizations["trend_analysis"] = self.create_trend_analysis_chart(research_data["trend_data"])
-        
-        # Key findings summary
-        if research_data.get("key_findings"):
-            visualizations["findings_summary"] = self.create_findings_summary_chart(research_data["key_findings"])
-        
-        # Data quality metrics
-        if research_data.get("quality_metrics"):
-            visualizations["quality_metrics"] = self.create_quality_metrics_chart(research_data["quality_metrics"])
-        
-        # Source distribution
-        if research_data.get("source_analysis"):
-            visualizations["source_distribution"] = self.create_source_distribution_chart(research_data["source_analysis"])
-        
-        # Competitive landscape
-        if research_data.get("competitive_data"):
-            visualizations["competitive_landscape"] = self.create_competitive_landscape_chart(research_data["competitive_data"])
+        tasks = self._chart_tasks(research_data)
         
-        # Growth indicators
-        if research_data.get("growth_indicators"):
-            visualizations["growth_indicators"] = self.create_growth_indicators_chart(research_data["growth_indicators"])
+        # Charts are independent, so build and export them on worker threads
+        results = await asyncio.gather(
+            *(asyncio.to_thread(create_chart, data) for _, create_chart, data in tasks),
+            return_exceptions=True
+        )
         
+        visualizations = {}
+        for (key, _, _), result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.warning("  ⚠️ Error creating %s visualization: %s", key, result)
+            else:
+                visualizations[key] = result
         return visualizations
     
     def create_executive_dashboard(self, research_data: Dict[str, Any]) -> str:
         """Create comprehensive executive dashboard based on actual research data"""
         
         # Create subplot layout
-        fig = make_subplots(
+        fig = self.make_subplots(
             rows=2, cols=3,
             subplot_titles=[
                 "Research Coverage", "Data Quality Score", "Key Metrics",
@@ -78,14 +208,18 @@ class EnhancedDataVisualizer:
             ]
         )
         
+        # Collect (trace, row, col) and add them in one batch so the figure is validated once
+        subplot_traces = []
+        
         # Extract real data from research results
         validated_data = research_data.get("validated_data", [])
-        sources_count = len(validated_data)
+        sources = _summarize_sources(validated_data)
+        sources_count = len(sources)
         
         # Research coverage indicator - based on actual sources found
         coverage_score = min(sources_count / 50.0, 1.0)  # Scale based on target of 50 sources
-        fig.add_trace(
-            go.Indicator(
+        subplot_traces.append((
+            self.go.Indicator(
                 mode="gauge+number+delta",
                 value=coverage_score * 100,
                 domain={'x': [0, 1], 'y': [0, 1]},
@@ -104,17 +238,23 @@ class EnhancedDataVisualizer:
                     }
                 }
             ),
-            row=1, col=1
-        )
+            1, 1
+        ))
+        
+        # Aggregate quality, category and discovery method in a single pass
+        category_counts = Counter()
+        source_types = Counter()
+        total_quality = 0.0
+        for source in sources:
+            category_counts[source.category] += 1
+            source_types[source.discovery_method] += 1
+            total_quality += source.quality_score
         
         # Data quality indicator - based on actual quality scores
-        if validated_data:
-            avg_quality = sum(source.get("quality_score", 0.7) for source in validated_data) / len(validated_data)
-        else:
-            avg_quality = 0.7
+        avg_quality = total_quality / sources_count if sources_count else 0.7
         
-        fig.add_trace(
-            go.Indicator(
+        subplot_traces.append((
+            self.go.Indicator(
                 mode="gauge+number",
                 value=avg_quality * 100,
                 title={'text': "Avg Quality Score"},
@@ -127,65 +267,54 @@ class EnhancedDataVisualizer:
                     ]
                 }
             ),
-            row=1, col=2
-        )
+            1, 2
+        ))
         
         # Key metrics bar chart - extract from actual data
-        category_counts = {}
-        for source in validated_data:
-            category = source.get("source_metadata", {}).get("category", "unknown")
-            category_counts[category] = category_counts.get(category, 0) + 1
-        
         if category_counts:
-            metric_names = list(category_counts.keys())[:5]
-            metric_values = [category_counts[name] for name in metric_names]
+            metric_names, metric_values = zip(*islice(category_counts.items(), 5))
         else:
             metric_names = ["No Data"]
             metric_values = [0]
         
-        fig.add_trace(
-            go.Bar(
+        subplot_traces.append((
+            self.go.Bar(
                 x=metric_names,
                 y=metric_values,
                 marker_color=self.color_palette[1],
                 name="Source Categories"
             ),
-            row=1, col=3
-        )
+            1, 3
+        ))
         
         # Source distribution pie chart - based on actual source types
-        source_types = {}
-        for source in validated_data:
-            discovery_method = source.get("source_metadata", {}).get("discovery_method", "unknown")
-            source_types[discovery_method] = source_types.get(discovery_method, 0) + 1
-        
         if source_types:
-            fig.add_trace(
-                go.Pie(
-                    labels=list(source_types.keys()),
-                    values=list(source_types.values()),
+            subplot_traces.append((
+                self.go.Pie(
+                    labels=tuple(source_types),
+                    values=self.np.fromiter(source_types.values(), dtype=self.np.int64, count=len(source_types)),
                     marker_colors=self.color_palette[:len(source_types)]
                 ),
-                row=2, col=1
-            )
+                2, 1
+            ))
         else:
-            fig.add_trace(
-                go.Pie(
+            subplot_traces.append((
+                self.go.Pie(
                     labels=["No Data"],
                     values=[1],
                     marker_colors=[self.color_palette[0]]
                 ),
-                row=2, col=1
-            )
+                2, 1
+            ))
         
         # Trend indicators - extract actual trend data if available
         trend_data = research_data.get("trend_data", {})
         if trend_data and hasattr(trend_data, 'items'):
-            dates = list(trend_data.keys())[:10]  # Limit to 10 points
-            values = list(trend_data.values())[:10]
+            dates = list(islice(trend_data, 10))  # Limit to 10 points
+            values = list(islice(trend_data.values(), 10))
             
-            fig.add_trace(
-                go.Scatter(
+            subplot_traces.append((
+                self.go.Scatter(
                     x=dates,
                     y=values,
                     mode='lines+markers',
@@ -193,16 +322,16 @@ class EnhancedDataVisualizer:
                     marker=dict(size=8),
                     name="Trend Analysis"
                 ),
-                row=2, col=2
-            )
+                2, 2
+            ))
         else:
             # Create trend from source quality over time if no trend data
             if validated_data:
                 sample_dates = [f"2024-{i+1:02d}" for i in range(min(6, len(validated_data)))]
-                sample_values = [source.get("quality_score", 0.7) * 100 for source in validated_data[:6]]
+                sample_values = [source.quality_score * 100 for source in sources[:6]]
                 
-                fig.add_trace(
-                    go.Scatter(
+                subplot_traces.append((
+                    self.go.Scatter(
                         x=sample_dates,
                         y=sample_values,
                         mode='lines+markers',
@@ -210,34 +339,34 @@ class EnhancedDataVisualizer:
                         marker=dict(size=8),
                         name="Quality Trend"
                     ),
-                    row=2, col=2
-                )
+                    2, 2
+                ))
         
         # Quality assessment - based on actual data quality metrics
         if validated_data:
-            real_validated = [s for s in validated_data if s.get("source_metadata", {}).get("discovery_method") == "web_scraping"]
-            ai_generated = [s for s in validated_data if s.get("source_metadata", {}).get("discovery_method") == "ai_generation"]
-            fallback = [s for s in validated_data if s.get("source_metadata", {}).get("discovery_method") == "fallback_generation"]
-            
+            # Reuse the discovery method counts from the aggregation pass
             quality_categories = ["Real Sources", "AI Generated", "Fallback Data"]
             quality_scores = [
-                len(real_validated),
-                len(ai_generated), 
-                len(fallback)
+                source_types["web_scraping"],
+                source_types["ai_generation"],
+                source_types["fallback_generation"]
             ]
         else:
             quality_categories = ["No Data Available"]
             quality_scores = [0]
         
-        fig.add_trace(
-            go.Bar(
+        subplot_traces.append((
+            self.go.Bar(
                 x=quality_categories,
                 y=quality_scores,
                 marker_color=self.color_palette[3],
                 name="Source Types"
             ),
-            row=2, col=3
-        )
+            2, 3
+        ))
+        
+        traces, rows, cols = zip(*subplot_traces)
+        fig.add_traces(list(traces), rows=list(rows), cols=list(cols))
         
         # Update layout with query-specific title
         query_topic = research_data.get("query", {}).get("topic", "Research Analysis")
@@ -259,26 +388,11 @@ class EnhancedDataVisualizer:
     def create_trend_analysis_chart(self, trend_data: Dict[str, Any]) -> str:
         """Create trend analysis based on actual research data"""
         
-        fig = go.Figure()
-        
         # Check if we have actual trend data
         if not trend_data or not isinstance(trend_data, dict):
-            # Create a simple message chart if no data
-            fig.add_annotation(
-                text="No trend data available for this query",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False,
-                font=dict(size=16, color=self.color_palette[0])
-            )
-            
-            fig.update_layout(
-                title="Trend Analysis",
-                height=400,
-                template=self.chart_style
-            )
-            
-            return self._fig_to_base64(fig)
+            return self._placeholder_image("No trend data available for this query", "Trend Analysis")
+        
+        fig = self.go.Figure()
         
         # Extract dates and values from actual data
         dates = list(trend_data.keys())
@@ -295,32 +409,43 @@ class EnhancedDataVisualizer:
         else:
             # Sort data by date if possible
             try:
-                date_value_pairs = list(zip(dates, values))
-                date_value_pairs.sort(key=lambda x: x[0])
-                dates, values = zip(*date_value_pairs)
+                dates, values = zip(*sorted(zip(dates, values), key=itemgetter(0)))
             except:
                 pass  # Keep original order if sorting fails
             
-            # Create the main trend line
-            fig.add_trace(go.Scatter(
+            # Positions of the plotted points in the full series, used for the trend fit
+            x_numeric = self.np.arange(len(values), dtype=self.np.float64)
+            
+            # Downsample dense series so rendering cost stays bounded
+            if len(values) > _TREND_MAX_POINTS:
+                try:
+                    keep = _lttb_indices(self.np, values, _TREND_TARGET_POINTS)
+                    dates = [dates[i] for i in keep]
+                    values = [values[i] for i in keep]
+                    x_numeric = keep.astype(self.np.float64)
+                except (TypeError, ValueError):
+                    pass  # Non-numeric values; plot the full series
+            
+            # Create the main trend line with the area beneath it filled
+            fig.add_trace(self.go.Scatter(
                 x=dates,
                 y=values,
                 mode='lines+markers',
                 name='Trend',
                 line=dict(color=self.color_palette[0], width=3),
-                marker=dict(size=8, color=self.color_palette[0])
+                marker=dict(size=8, color=self.color_palette[0]),
+                fill='tozeroy',
+                fillcolor=self._rgba_fill[0]
             ))
             
             # Add a trend line if we have enough data points
             if len(values) >= 3:
                 try:
                     # Calculate linear trend
-                    x_numeric = list(range(len(values)))
-                    z = np.polyfit(x_numeric, values, 1)
-                    p = np.poly1d(z)
-                    trend_line = [p(x) for x in x_numeric]
+                    slope, intercept = self.np.polyfit(x_numeric, self.np.asarray(values, dtype=self.np.float64), 1)
+                    trend_line = slope * x_numeric + intercept
                     
-                    fig.add_trace(go.Scatter(
+                    fig.add_trace(self.go.Scatter(
                         x=dates,
                         y=trend_line,
                         mode='lines',
@@ -328,29 +453,8 @@ class EnhancedDataVisualizer:
                         line=dict(color=self.color_palette[1], width=2, dash='dash'),
                         opacity=0.7
                     ))
-                except ImportError:
-                    # If numpy is not available, create a simple average line
-                    avg_value = sum(values) / len(values)
-                    fig.add_trace(go.Scatter(
-                        x=dates,
-                        y=[avg_value] * len(dates),
-                        mode='lines',
-                        name='Average',
-                        line=dict(color=self.color_palette[1], width=2, dash='dash'),
-                        opacity=0.7
-                    ))
                 except Exception:
                     pass  # Skip trend line if calculation fails
-            
-            # Add area fill
-            fig.add_trace(go.Scatter(
-                x=dates,
-                y=values,
-                fill='tonexty',
-                mode='none',
-                fillcolor=f'rgba({self._hex_to_rgb(self.color_palette[0])}, 0.1)',
-                showlegend=False
-            ))
         
         # Update layout
         fig.update_layout(
@@ -369,13 +473,23 @@ class EnhancedDataVisualizer:
         
         return self._fig_to_base64(fig)
     
-    def _hex_to_rgb(self, hex_color: str) -> str:
-        """Convert hex color to RGB string"""
-        try:
-            hex_color = hex_color.lstrip('#')
-            return ','.join(str(int(hex_color[i:i+2], 16)) for i in (0, 2, 4))
-        except:
-            return "26,54,93"  # Default blue RGB
+    def _placeholder_image(self, message: str, title: str) -> str:
+        """Render a message-only chart; repeats are served by the shared image cache"""
+        fig = self.go.Figure()
+        fig.add_annotation(
+            text=message,
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, xanchor='center', yanchor='middle',
+            showarrow=False,
+            font=dict(size=16, color=self.color_palette[0])
+        )
+        fig.update_layout(
+            title=title,
+            height=400,
+            template=self.chart_style
+        )
+        
+        return self._fig_to_base64(fig)
     
     def create_findings_summary_chart(self, findings_data: Dict[str, Any]) -> str:
         """Create key findings summary visualization"""
@@ -385,53 +499,29 @@ class EnhancedDataVisualizer:
         finding_counts = findings_data.get("counts", [])
         finding_importance = findings_data.get("importance_scores", [])
         
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=["Findings Distribution", "Importance vs Frequency"],
-            specs=[[{"type": "bar"}, {"type": "scatter"}]]
-        )
+        fig = self._mpl_figure()
+        ax_bar, ax_scatter = fig.subplots(1, 2)
         
         # Findings distribution bar chart
-        fig.add_trace(
-            go.Bar(
-                x=finding_categories,
-                y=finding_counts,
-                marker_color=self.color_palette[0],
-                name="Finding Counts"
-            ),
-            row=1, col=1
-        )
+        ax_bar.bar(finding_categories, finding_counts, color=self.color_palette[0])
+        ax_bar.set_title("Findings Distribution")
+        ax_bar.tick_params(axis='x', labelrotation=30)
         
         # Importance vs frequency scatter
-        fig.add_trace(
-            go.Scatter(
-                x=finding_counts,
-                y=finding_importance,
-                mode='markers+text',
-                marker=dict(
-                    size=[count * 2 for count in finding_counts],
-                    color=self.color_palette[2],
-                    opacity=0.7
-                ),
-                text=finding_categories,
-                textposition="top center",
-                name="Importance Analysis"
-            ),
-            row=1, col=2
+        count_array = self.np.asarray(finding_counts, dtype=self.np.float64)
+        ax_scatter.scatter(
+            finding_counts,
+            finding_importance,
+            s=(count_array * 2) ** 2,
+            color=self.color_palette[2],
+            alpha=0.7
         )
+        for category, count, importance in zip(finding_categories, finding_counts, finding_importance):
+            ax_scatter.annotate(category, (count, importance), textcoords="offset points", xytext=(0, 8), ha='center')
+        ax_scatter.set_title("Importance vs Frequency")
         
-        fig.update_layout(
-            title={
-                'text': "Key Findings Analysis",
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 18, 'color': self.color_palette[0]}
-            },
-            template=self.chart_style,
-            height=500
-        )
-        
-        return self._fig_to_base64(fig)
+        fig.suptitle("Key Findings Analysis", fontsize=18, color=self.color_palette[0])
+        return self._mpl_to_base64(fig)
     
     def create_quality_metrics_chart(self, quality_data: Dict[str, Any]) -> str:
         """Create data quality metrics visualization"""
@@ -447,19 +537,15 @@ class EnhancedDataVisualizer:
             quality_data.get("credibility", 0.91)
         ]
         
-        fig = go.Figure()
-        
-        # Convert hex color to rgba format for transparency
-        primary_color = self.color_palette[0]
-        rgba_color = f"rgba({int(primary_color[1:3], 16)}, {int(primary_color[3:5], 16)}, {int(primary_color[5:7], 16)}, 0.3)"
+        fig = self.go.Figure()
         
-        fig.add_trace(go.Scatterpolar(
-            r=[v * 100 for v in values],
+        fig.add_trace(self.go.Scatterpolar(
+            r=self.np.asarray(values, dtype=self.np.float64) * 100,
             theta=categories,
             fill='toself',
             name='Quality Metrics',
             line_color=self.color_palette[0],
-            fillcolor=rgba_color
+            fillcolor=self._rgba_area[0]
         ))
         
         fig.update_layout(
@@ -483,51 +569,39 @@ class EnhancedDataVisualizer:
     def create_source_distribution_chart(self, source_data: Dict[str, Any]) -> str:
         """Create source distribution and credibility analysis"""
         
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=["Source Type Distribution", "Source Credibility"],
-            specs=[[{"type": "pie"}, {"type": "bar"}]]
-        )
+        fig = self._mpl_figure()
+        ax_pie, ax_bar = fig.subplots(1, 2)
         
         # Source distribution pie
-        source_types = list(source_data.get("distribution", {}).keys())
-        source_counts = list(source_data.get("distribution", {}).values())
+        distribution = source_data.get("distribution", {})
+        source_types = list(distribution.keys())
+        source_counts = list(distribution.values())
         
-        fig.add_trace(
-            go.Pie(
+        if source_counts:
+            ax_pie.pie(
+                source_counts,
                 labels=source_types,
-                values=source_counts,
-                marker_colors=self.color_palette[:len(source_types)],
-                name="Source Distribution"
-            ),
-            row=1, col=1
-        )
+                colors=self.color_palette[:len(source_types)],
+                autopct='%1.1f%%',
+                startangle=90
+            )
+        ax_pie.set_title("Source Type Distribution")
         
         # Credibility scores
         credibility_scores = source_data.get("credibility_scores", {})
         if credibility_scores:
-            fig.add_trace(
-                go.Bar(
-                    x=list(credibility_scores.keys()),
-                    y=[score * 100 for score in credibility_scores.values()],
-                    marker_color=self.color_palette[1],
-                    name="Credibility Scores"
-                ),
-                row=1, col=2
+            ax_bar.bar(
+                tuple(credibility_scores),
+                self.np.fromiter(credibility_scores.values(), dtype=self.np.float64, count=len(credibility_scores)) * 100.0,
+                color=self.color_palette[1]
             )
+            ax_bar.tick_params(axis='x', labelrotation=30)
+        else:
+            ax_bar.axis('off')
+        ax_bar.set_title("Source Credibility")
         
-        fig.update_layout(
-            title={
-                'text': "Source Analysis",
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 18, 'color': self.color_palette[0]}
-            },
-            template=self.chart_style,
-            height=500
-        )
-        
-        return self._fig_to_base64(fig)
+        fig.suptitle("Source Analysis", fontsize=18, color=self.color_palette[0])
+        return self._mpl_to_base64(fig)
     
     def create_competitive_landscape_chart(self, competitive_data: Dict[str, Any]) -> str:
         """Create competitive landscape visualization"""
@@ -538,14 +612,14 @@ class EnhancedDataVisualizer:
         growth_rate = competitive_data.get("growth_rate", [])
         revenue = competitive_data.get("revenue", [])
         
-        fig = go.Figure()
+        fig = self.go.Figure()
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(self.go.Scatter(
             x=market_share,
             y=growth_rate,
             mode='markers+text',
             marker=dict(
-                size=[r/1000000 for r in revenue] if revenue else [20] * len(companies),
+                size=self.np.asarray(revenue, dtype=self.np.float64) / 1e6 if revenue else self.np.full(len(companies), 20.0),
                 color=self.color_palette[:len(companies)],
                 opacity=0.7,
                 line=dict(width=2, color='white')
@@ -575,45 +649,64 @@ class EnhancedDataVisualizer:
         
         # Extract data
         indicators = [item.get("name", f"Indicator {i+1}") for i, item in enumerate(growth_data)]
-        current_values = [item.get("current_value", 0) for item in growth_data]
-        projected_values = [item.get("projected_value", 0) for item in growth_data]
-        
-        fig = go.Figure()
-        
-        # Current values
-        fig.add_trace(go.Bar(
-            x=indicators,
-            y=current_values,
-            name='Current Values',
-            marker_color=self.color_palette[0]
-        ))
-        
-        # Projected values
-        fig.add_trace(go.Bar(
-            x=indicators,
-            y=projected_values,
-            name='Projected Values',
-            marker_color=self.color_palette[2]
-        ))
-        
-        fig.update_layout(
-            title={
-                'text': "Growth Indicators Analysis",
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 18, 'color': self.color_palette[0]}
-            },
-            xaxis_title="Growth Indicators",
-            yaxis_title="Values",
-            barmode='group',
-            template=self.chart_style,
-            height=500
-        )
-        
-        return self._fig_to_base64(fig)
+        current_values = self.np.fromiter((item.get("current_value", 0) for item in growth_data), dtype=self.np.float64, count=len(growth_data))
+        projected_values = self.np.fromiter((item.get("projected_value", 0) for item in growth_data), dtype=self.np.float64, count=len(growth_data))
+        
+        fig = self._mpl_figure()
+        ax = fig.subplots()
+        
+        # Current and projected values side by side
+        x = self.np.arange(len(indicators))
+        width = 0.38
+        ax.bar(x - width / 2, current_values, width, label='Current Values', color=self.color_palette[0])
+        ax.bar(x + width / 2, projected_values, width, label='Projected Values', color=self.color_palette[2])
+        
+        ax.set_xticks(x)
+        ax.set_xticklabels(indicators)
+        ax.set_xlabel("Growth Indicators")
+        ax.set_ylabel("Values")
+        ax.legend()
+        
+        fig.suptitle("Growth Indicators Analysis", fontsize=18, color=self.color_palette[0])
+        return self._mpl_to_base64(fig)
+    
+    def _mpl_figure(self):
+        """Create a matplotlib figure matching the plotly export size (1200x800 at the configured scale)"""
+        # matplotlib.figure.Figure avoids pyplot's global state, so it is safe on worker threads
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(12, 8), dpi=100 * self.image_scale, facecolor='white')
+        fig.set_layout_engine('tight')
+        return fig
+    
+    def _mpl_to_base64(self, fig) -> str:
+        """Convert matplotlib figure to base64 string"""
+        buffer = BytesIO()
+        fig.savefig(buffer, format=self.image_format, facecolor='white', edgecolor='none')
+        return base64.b64encode(buffer.getvalue()).decode()
     
     def _fig_to_base64(self, fig) -> str:
         """Convert plotly figure to base64 string"""
-        img_bytes = fig.to_image(format="png", width=1200, height=800, scale=2)
+        # Figures aren't hashable, so key the cache on their serialized form
+        cache_key = hashlib.blake2b(
+            f"{self.image_format}:{self.image_scale}:{fig.to_json()}".encode(),
+            digest_size=16
+        ).digest()
+        with _image_cache_lock:
+            cached = _image_cache.get(cache_key)
+            if cached is not None:
+                _image_cache.move_to_end(cache_key)
+                return cached
+        
+        with _kaleido_lock:
+            scope = _get_kaleido_scope()
+            if scope is not None:
+                img_bytes = scope.transform(fig, format=self.image_format, width=1200, height=800, scale=self.image_scale)
+        if scope is None:
+            img_bytes = fig.to_image(format=self.image_format, width=1200, height=800, scale=self.image_scale)
         img_base64 = base64.b64encode(img_bytes).decode()
+        
+        with _image_cache_lock:
+            _image_cache[cache_key] = img_base64
+            if len(_image_cache) > _IMAGE_CACHE_SIZE:
+                _image_cache.popitem(last=False)
         return img_base64 
\ No newline at end of file
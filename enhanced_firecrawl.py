@@ -1,79 +1,738 @@
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, AsyncIterator, Iterable, NamedTuple, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import aiohttp
 import asyncio
-from urllib.parse import urljoin, urlparse
+import functools
+import hashlib
+from urllib.parse import quote_plus, urljoin, urlsplit
 import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from operator import itemgetter
 from datetime import datetime
+from types import MappingProxyType
 from openai import AsyncOpenAI
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - httpx negotiates HTTP/2 only when this is installed
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# More comprehensive extraction schema, built once and shared read-only by every scrape
+_EXTRACTION_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "authors": {"type": "array", "items": {"type": "string"}},
+        "publication_date": {"type": "string"},
+        "abstract": {"type": "string"},
+        "executive_summary": {"type": "string"},
+        "key_findings": {"type": "array", "items": {"type": "string"}},
+        "methodology": {"type": "string"},
+        "data_points": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "metric": {"type": "string"},
+                    "value": {"type": "string"},
+                    "unit": {"type": "string"},
+                    "context": {"type": "string"},
+                    "source": {"type": "string"},
+                    "date": {"type": "string"}
+                }
+            }
+        },
+        "financial_data": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "company": {"type": "string"},
+                    "metric": {"type": "string"},
+                    "value": {"type": "string"},
+                    "period": {"type": "string"}
+                }
+            }
+        },
+        "investment_data": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "company": {"type": "string"},
+                    "investor": {"type": "string"},
+                    "amount": {"type": "string"},
+                    "date": {"type": "string"},
+                    "round_type": {"type": "string"},
+                    "sector": {"type": "string"}
+                }
+            }
+        },
+        "market_analysis": {
+            "type": "object",
+            "properties": {
+                "market_size": {"type": "string"},
+                "growth_rate": {"type": "string"},
+                "key_players": {"type": "array", "items": {"type": "string"}},
+                "trends": {"type": "array", "items": {"type": "string"}}
+            }
+        },
+        "tables": {"type": "array", "items": {"type": "object"}},
+        "charts": {"type": "array", "items": {"type": "object"}},
+        "conclusions": {"type": "array", "items": {"type": "string"}},
+        "references": {"type": "array", "items": {"type": "string"}},
+        "contact_information": {
+            "type": "object",
+            "properties": {
+                "company": {"type": "string"},
+                "email": {"type": "string"},
+                "phone": {"type": "string"},
+                "address": {"type": "string"}
+            }
+        }
+    }
+})
+
+_BASE_SCRAPE_OPTIONS = MappingProxyType({
+    "formats": ["markdown"],  # Nothing downstream reads the HTML
+    "onlyMainContent": True,
+    "waitFor": 3000,  # Wait longer for dynamic content
+    "extract": {"schema": _EXTRACTION_SCHEMA},
+    "timeout": 30000  # 30 second timeout
+})
+
+# Everything after the URL is constant, so it is encoded once at import minus the opening brace
+_SCRAPE_BODY_TAIL = _json_dumps(
+    {**_BASE_SCRAPE_OPTIONS, "extract": {"schema": dict(_EXTRACTION_SCHEMA)}}
+)[1:]
+
+# Scrape results barely change within a day, so repeated topics reuse them
+_SCRAPE_CACHE_SIZE = 1024
+_SCRAPE_CACHE_TTL = 86400  # seconds
+_scrape_cache = OrderedDict()
+
+# Scrapes also persist across runs in an SQLite file under TEMP_DIR, zlib-compressed
+_DISK_CACHE_FILENAME = "research_cache.sqlite3"
+_disk_cache_conn = None
+_disk_cache_lock = threading.Lock()
+
+def _disk_cache_connection() -> sqlite3.Connection:
+    global _disk_cache_conn
+    if _disk_cache_conn is None:
+        # Resolved on first use, after the entry point has had a chance to load .env
+        cache_dir = os.getenv("TEMP_DIR", "./temp")
+        os.makedirs(cache_dir, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(cache_dir, _DISK_CACHE_FILENAME), check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS scrape_cache (key TEXT PRIMARY KEY, ts REAL, body BLOB)")
+        conn.execute("CREATE TABLE IF NOT EXISTS completion_cache (key TEXT PRIMARY KEY, ts REAL, body BLOB)")
+        _disk_cache_conn = conn
+    return _disk_cache_conn
+
+def _disk_cache_get(table: str, key: str, ttl: float) -> Optional[bytes]:
+    """Return the cached payload for key if it is younger than ttl seconds (blocking; run in a thread)"""
+    try:
+        with _disk_cache_lock:
+            row = _disk_cache_connection().execute(
+                f"SELECT ts, body FROM {table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row and time.time() - row[0] < ttl:
+            return zlib.decompress(row[1])
+    except (sqlite3.Error, OSError, zlib.error) as e:
+        logger.debug("Disk cache read failed: %s", e)
+    return None
+
+def _disk_cache_put(table: str, key: str, payload: bytes):
+    """Store payload under key (blocking; run in a thread)"""
+    try:
+        with _disk_cache_lock:
+            conn = _disk_cache_connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, ts, body) VALUES (?, ?, ?)",
+                (key, time.time(), zlib.compress(payload))
+            )
+            conn.commit()
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Disk cache write failed: %s", e)
+
+# Enrichment and verification prompts repeat across runs on the same sources
+_COMPLETION_CACHE_TTL = 7 * 86400  # seconds
+
+# Concurrent OpenAI requests per client; keeps fan-outs under per-minute rate limits
+_OPENAI_CONCURRENCY = 8
+_OPENAI_MAX_RETRIES = 4
+
+def _openai_http_client():
+    """HTTP client for OpenAI sized for concurrent fan-outs; None falls back to the SDK default"""
+    if httpx is None:
+        return None
+    return httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,  # Multiplex concurrent requests over one connection when h2 is installed
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        # Keep the SDK's own 600s read budget: a non-streamed 4k-token batch reply can take well
+        # over 30s, and a short read timeout would just burn every retry; only connect is tightened
+        timeout=httpx.Timeout(600.0, connect=5.0)
+    )
+
+# One OpenAI client (and its connection pool) per API key and event loop, shared by every research
+# client on that loop and closed when the loop's last one releases its hold
+_openai_clients = weakref.WeakKeyDictionary()
+_openai_clients_lock = threading.Lock()
+
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared OpenAI client for the given API key on the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _openai_clients_lock:
+        # Pools bound to finished loops can't be reused; drop them
+        for stale in [stale for stale in list(_openai_clients.keys()) if stale.is_closed()]:
+            del _openai_clients[stale]
+        clients = _openai_clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            # Retries rate limits and connection errors with exponential backoff before surfacing them
+            client = clients[api_key] = AsyncOpenAI(api_key=api_key, max_retries=_OPENAI_MAX_RETRIES,
+                                                    http_client=_openai_http_client())
+    return client
+
+async def close_shared_openai_clients():
+    """Close the running loop's shared OpenAI clients and their connection pools"""
+    with _openai_clients_lock:
+        clients = _openai_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+# Sources sent to OpenAI per enrichment request; amortizes the system prompt and round trip
+_ENRICH_BATCH_SIZE = 10
+
+# Sources fact-checked per verification request
+_VERIFY_BATCH_SIZE = 8
+
+# Enrichment runs on the small model; answers that fail validation or score below
+# 4/10 are re-asked of the larger one
+_ENRICH_MODEL = "gpt-4o-mini"
+_ENRICH_FALLBACK_MODEL = "gpt-4o"
+_ENRICH_ESCALATE_BELOW = 4
+
+# Weighted fields for the basic quality score, and the score for every presence combination
+_QUALITY_FIELDS = ("title", "authors", "publication_date", "key_findings",
+                   "methodology", "data_points", "investment_data", "market_analysis")
+_QUALITY_WEIGHTS = (0.15, 0.1, 0.1, 0.25, 0.1, 0.15, 0.1, 0.05)
+_QUALITY_SCORE_LUT = tuple(
+    min(sum((w for bit, w in enumerate(_QUALITY_WEIGHTS) if mask >> bit & 1), 0.0), 1.0)
+    for mask in range(1 << len(_QUALITY_FIELDS))
+)
+
+# Binary documents and media that Firecrawl's HTML extraction can't use
+_NON_HTML_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.mp4', '.zip')
+
+# Downstream report sections never use more than the opening of a page
+_MAX_MARKDOWN_CHARS = 20000
+_BLANK_LINES_RE = re.compile(r"\n\s*\n(?:\s*\n)+")
+
+# Response bodies above this size are parsed in a worker thread
+_LARGE_BODY_BYTES = 256 * 1024
+
+# Transient connection errors, timeouts and 5xx responses are retried this many times in total,
+# all within one per-URL deadline so retries can't multiply the worst case
+_SCRAPE_ATTEMPTS = 3
+_SCRAPE_DEADLINE = 45.0  # seconds; room for one full 30s Firecrawl run plus network overhead
+_SCRAPE_MIN_ATTEMPT = 5.0  # seconds; a retry with less budget than this left isn't attempted
+
+# One connection pool per event loop, shared by every client on that loop and refcounted across
+# their context managers; a loop's entry is retired once that loop has closed
+_shared_sessions = weakref.WeakKeyDictionary()
+_shared_sessions_lock = threading.Lock()  # Loops on other threads touch the same map
+_retiring_sessions = set()  # Close tasks for retired sessions, kept referenced until they finish
+
+class _SharedSession:
+    """A loop's shared HTTP session and how many client context managers currently hold it"""
+    __slots__ = ("session", "users")
+    
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        self.users = 0
+
+def _new_shared_session() -> aiohttp.ClientSession:
+    """Build the pooled HTTP session used for Firecrawl requests"""
+    # Keep connections and DNS lookups warm across scrapes of the same API host
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=32,
+        ttl_dns_cache=600,  # api.firecrawl.dev rarely moves; resolve it once per run
+        keepalive_timeout=30,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        # Firecrawl is asked to finish within 30s; fail fast on connect, leave headroom to read
+        timeout=aiohttp.ClientTimeout(total=45, connect=5, sock_read=35),
+        # Any json= request body goes through the same fast encoder as the scrape bodies
+        json_serialize=lambda obj: _json_dumps(obj).decode()
+    )
+
+def _shared_session_entry() -> _SharedSession:
+    """Return the running loop's shared session entry, creating the session on first use"""
+    loop = asyncio.get_running_loop()
+    with _shared_sessions_lock:
+        _retire_closed_loop_sessions()
+        entry = _shared_sessions.get(loop)
+        if entry is None:
+            entry = _shared_sessions[loop] = _SharedSession(_new_shared_session())
+        elif entry.session.closed:
+            entry.session = _new_shared_session()
+    return entry
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the HTTP session shared on the running loop, creating it on first use"""
+    return _shared_session_entry().session
+
+def _retire_closed_loop_sessions():
+    """Close sessions whose event loop has finished so their connectors don't leak; call under the lock"""
+    # Sessions hold their loop, so finished loops stay in the map until swept here
+    for loop in [loop for loop in list(_shared_sessions.keys()) if loop.is_closed()]:
+        session = _shared_sessions.pop(loop).session
+        if not session.closed:
+            # Nothing is left to flush on a closed loop; closing releases the connector
+            # and silences aiohttp's unclosed-session warning
+            task = asyncio.ensure_future(session.close())
+            _retiring_sessions.add(task)
+            task.add_done_callback(_retiring_sessions.discard)
+
+async def close_shared_session():
+    """Close the running loop's shared HTTP session; the next request opens a fresh one"""
+    with _shared_sessions_lock:
+        entry = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None and not entry.session.closed:
+        await entry.session.close()
+
+# Search pages per platform; {q} is the URL-encoded topic
+_INVESTMENT_SEARCH_TEMPLATES = (
+    "https://www.crunchbase.com/search/funding_rounds?query={q}",
+    "https://www.techinasia.com/search?q={q}",
+    "https://e27.co/search?q={q}",
+    "https://www.dealstreetasia.com/search?q={q}",
+    "https://www.bloomberg.com/search?query={q}+investment"
+)
+_GENERAL_SEARCH_TEMPLATES = (
+    "https://www.reuters.com/site-search/?query={q}",
+    "https://www.mckinsey.com/search?q={q}",
+    "https://www.bcg.com/search?q={q}",
+    "https://www.statista.com/search/?q={q}",
+    "https://www.marketresearch.com/search/?query={q}"
+)
+
+@functools.lru_cache(maxsize=256)
+def _search_urls_for_topic(topic: str) -> Tuple[str, ...]:
+    """Search URLs for a topic, investment platforms first, capped at 10"""
+    # quote_plus keeps '&', '?', '#' and non-ASCII topics from corrupting the query string
+    q = quote_plus(topic)
+    templates = _GENERAL_SEARCH_TEMPLATES
+    if any(term in topic.lower() for term in ("investment", "venture", "funding")):
+        templates = _INVESTMENT_SEARCH_TEMPLATES + templates
+    # dict.fromkeys drops repeats across template groups while keeping order
+    return tuple(dict.fromkeys(template.format(q=q) for template in templates))[:10]
+
+# Free-text research responses: a source starts at "Title:", "1." or "Source"; findings are bullets
+_RESEARCH_HEADER_RE = re.compile(r"(?:Title:|1\.|(?=Source))(.*)")
+_RESEARCH_BULLET_RE = re.compile(r"[-•][-•\s]*(.*)")
+
+@dataclass(frozen=True)
 class ResearchQuery:
+    # Explicit slots (dataclass(slots=True) needs Python 3.10) drop the per-instance __dict__
+    __slots__ = ("topic", "keywords", "sources", "depth", "timeframe")
+    
     topic: str
-    keywords: List[str]
-    sources: List[str]
+    keywords: Sequence[str]
+    sources: Sequence[str]
     depth: str  # "basic", "comprehensive", "expert"
     timeframe: str  # "current", "historical", "trend_analysis"
+    
+    def __post_init__(self):
+        # Store sequences as tuples so queries are immutable and hashable (usable as cache keys)
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        object.__setattr__(self, "sources", tuple(self.sources))
+
+class ScrapedPage(NamedTuple):
+    """The fields the research pipeline reads from one Firecrawl scrape"""
+    url: str
+    title: Optional[str]
+    key_findings: List[str]
+    data_points: List[Dict[str, Any]]
+    
+    @classmethod
+    def from_response(cls, url: str, result: Dict[str, Any]) -> "ScrapedPage":
+        # v0 nests schema extraction under data.llm_extraction; older responses put it at the top level
+        page = result.get("data")
+        extracted = page.get("llm_extraction") if isinstance(page, dict) else None
+        if not isinstance(extracted, dict):
+            extracted = result
+        return cls(
+            url=result.get("source_url", url),
+            title=extracted.get("title"),
+            key_findings=extracted.get("key_findings") or [],
+            data_points=extracted.get("data_points") or []
+        )
+
+# Fallback sources are static apart from the topic; built once and shallow-copied per use.
+# Downstream steps only add top-level keys, so the nested lists and dicts are shared read-only.
+_ANTHILL_FALLBACK_SOURCE = {
+    "title": "Anthill Ventures Investment Portfolio Analysis",
+    "source_url": "synthetic_data_anthill_ventures",
+    "key_findings": [
+        "Anthill Ventures focuses primarily on early-stage B2B SaaS companies",
+        "Average investment size ranges from $500K to $2M in seed rounds",
+        "Portfolio companies show 80% survival rate after 3 years",
+        "Key sectors include fintech, healthtech, and enterprise software",
+        "Geographic focus on Southeast Asia and India markets"
+    ],
+    "investment_data": [
+        {
+            "company": "TechFlow Solutions",
+            "investor": "Anthill Ventures",
+            "amount": "$1.2M",
+            "date": "2024-Q1",
+            "round_type": "Seed",
+            "sector": "Enterprise SaaS"
+        },
+        {
+            "company": "HealthMetrics AI",
+            "investor": "Anthill Ventures",
+            "amount": "$800K",
+            "date": "2024-Q2",
+            "round_type": "Pre-Seed",
+            "sector": "HealthTech"
+        },
+        {
+            "company": "FinanceCore",
+            "investor": "Anthill Ventures",
+            "amount": "$1.5M",
+            "date": "2023-Q4",
+            "round_type": "Seed",
+            "sector": "FinTech"
+        },
+        {
+            "company": "DataBridge Analytics",
+            "investor": "Anthill Ventures",
+            "amount": "$900K",
+            "date": "2024-Q1",
+            "round_type": "Seed",
+            "sector": "Data Analytics"
+        },
+        {
+            "company": "CloudOps Pro",
+            "investor": "Anthill Ventures",
+            "amount": "$1.1M",
+            "date": "2024-Q2",
+            "round_type": "Seed",
+            "sector": "DevOps"
+        }
+    ],
+    "market_analysis": {
+        "market_size": "$45B Southeast Asian startup ecosystem",
+        "growth_rate": "25% YoY in early-stage investments",
+        "key_players": ["Anthill Ventures", "Alpha JWC", "Golden Gate Ventures", "Sequoia Capital SEA"],
+        "trends": [
+            "Increasing focus on B2B SaaS solutions",
+            "Growing interest in AI-powered startups",
+            "Expansion into emerging markets",
+            "Higher average deal sizes in 2024"
+        ]
+    },
+    "data_points": [
+        {
+            "metric": "Portfolio Size",
+            "value": "45",
+            "unit": "companies",
+            "context": "Active portfolio companies as of 2024",
+            "source": "Anthill Ventures website",
+            "date": "2024"
+        },
+        {
+            "metric": "Average Investment",
+            "value": "1.1",
+            "unit": "million USD",
+            "context": "Typical seed round investment size",
+            "source": "Investment analysis",
+            "date": "2024"
+        }
+    ],
+    "quality_score": 0.85,
+    "ai_validated": False,
+    "source_metadata": {
+        "category": "investment_data",
+        "priority": "high",
+        "discovery_method": "fallback_generation"
+    }
+}
+
+_MARKET_FALLBACK_SOURCE = {
+    "source_url": "synthetic_market_research",
+    "key_findings": [
+        "Increasing investor interest in early-stage opportunities",
+        "Technology adoption driving market expansion",
+        "Regulatory environment becoming more favorable",
+        "Competition intensifying among established players"
+    ],
+    "data_points": [
+        {
+            "metric": "Market Growth Rate",
+            "value": "22",
+            "unit": "percent",
+            "context": "Year-over-year growth in investment volume",
+            "source": "Market analysis",
+            "date": "2024"
+        },
+        {
+            "metric": "Investment Volume",
+            "value": "2.8",
+            "unit": "billion USD",
+            "context": "Total investment in sector for 2024",
+            "source": "Industry reports",
+            "date": "2024"
+        }
+    ],
+    "quality_score": 0.75,
+    "ai_validated": False,
+    "source_metadata": {
+        "category": "market_research",
+        "priority": "medium",
+        "discovery_method": "fallback_generation"
+    }
+}
+
+# Keywords (matched as lowercase substrings) that put a finding into each trend bucket.
+# Each group is one compiled alternation, so a finding is scanned once per bucket.
+_GROWTH_KEYWORDS = ('growth', 'increase', 'rising', 'expanding', 'surge', 'boom', 'uptick')
+_SHIFT_KEYWORDS = ('shift', 'change', 'transition', 'move', 'pivot', 'transformation', 'evolution')
+_TECH_KEYWORDS = ('ai', 'artificial intelligence', 'machine learning', 'automation', 'digital', 'technology', 'innovation')
+_GROWTH_RE = re.compile("|".join(map(re.escape, _GROWTH_KEYWORDS)))
+_SHIFT_RE = re.compile("|".join(map(re.escape, _SHIFT_KEYWORDS)))
+_TECH_RE = re.compile("|".join(map(re.escape, _TECH_KEYWORDS)))
+
+# Competitive intelligence is static local data, built once; callers get a shallow copy
+# and downstream report code only reads the nested values
+_COMPETITIVE_DATA = {
+    "competitors": [
+        "Sequoia Capital SEA - Leading VC with $2.5B AUM, 150+ portfolio companies",
+        "Golden Gate Ventures - Early-stage focused, $100M+ deployed, 80+ investments",
+        "Alpha JWC - B2B SaaS specialist, $75M fund, 60+ portfolio companies",
+        "500 Startups - Global accelerator, 2,000+ companies, strong SEA presence",
+        "Monk's Hill Ventures - Enterprise tech focus, $50M+ invested, 40+ deals"
+    ],
+    "market_positioning": {
+        "anthill_ventures": {
+            "position": "Early-stage B2B SaaS specialist",
+            "avg_check_size": "$1.1M",
+            "portfolio_size": "45+ companies",
+            "geographic_focus": "Southeast Asia + India"
+        },
+        "market_share": "8.5% of early-stage deals in SEA",
+        "competitive_advantage": "Deep sector expertise in B2B SaaS and enterprise tech"
+    },
+    "pricing_analysis": {
+        "average_valuations": {
+            "pre_seed": "$2-5M",
+            "seed": "$8-15M", 
+            "series_a": "$25-50M"
+        },
+        "deal_sizes": {
+            "anthill_ventures": "$500K-2M",
+            "market_average": "$800K-1.8M"
+        }
+    },
+    "product_comparison": {
+        "investment_focus": "B2B SaaS, Enterprise Software, FinTech, HealthTech",
+        "stage_preference": "Seed to Series A",
+        "value_add": "Operational support, market expansion, technical guidance"
+    },
+    "sources_analyzed": 25
+}
+
+# Source prioritization: category weights and domains that earn a bonus
+_CATEGORY_SCORES = MappingProxyType({
+    "investment_data": 10,
+    "industry_reports": 9,
+    "financial_news": 8,
+    "academic": 7,
+    "government": 6,
+    "research_institutes": 5,
+    "general_web": 3
+})
+_PRIORITY_DOMAINS = ("crunchbase", "bloomberg", "reuters", "wsj")
+_PRIORITY_DOMAIN_RE = re.compile("|".join(map(re.escape, _PRIORITY_DOMAINS)))
+
+# Batches larger than this are quality-scored with NumPy instead of a Python loop
+_VECTORIZE_QUALITY_ABOVE = 64
+
+# Source credibility: base score per category, then domain adjustments
+_CREDIBILITY_BASE_SCORES = MappingProxyType({
+    "academic": 0.95,
+    "government": 0.90,
+    "industry_reports": 0.85,
+    "financial_news": 0.80,
+    "research_institutes": 0.85,
+    "investment_data": 0.75,
+    "industry_specific": 0.70,
+    "general_web": 0.50
+})
+_TRUSTED_DOMAINS = ("bloomberg", "reuters", "wsj", "ft.com")
+_QUESTIONABLE_DOMAINS = ("blog", "wordpress", "medium")
+# One compiled alternation per list, so each netloc is scanned once per list
+_TRUSTED_RE = re.compile("|".join(map(re.escape, _TRUSTED_DOMAINS)))
+_QUESTIONABLE_RE = re.compile("|".join(map(re.escape, _QUESTIONABLE_DOMAINS)))
+
+class _SourceSignals(NamedTuple):
+    """Per-source values derived from the URL and title, kept beside the source dicts rather than in them"""
+    title_lower: str
+    netloc: str
+    priority_bonus: int
+    domain_adjustment: float
+
+def _netloc(url: str) -> str:
+    """Lowercased host[:port] of a URL; a cheap stand-in for urlparse(url).netloc"""
+    _, sep, rest = url.partition("://")
+    host = (rest if sep else url).partition("/")[0]
+    return host.partition("?")[0].partition("#")[0].lower()
+
+# Topic-specific fallback sources, keyed by a lowercase phrase the query topic must contain
+_FALLBACK_REGISTRY = MappingProxyType({
+    "anthill ventures": _ANTHILL_FALLBACK_SOURCE
+})
 
 class AdvancedFirecrawlClient:
-    """Enhanced Firecrawl client with advanced research capabilities"""
+    """Enhanced Firecrawl client with advanced research capabilities
+    
+    Use it as ``async with AdvancedFirecrawlClient(...)`` (or call ``aclose()``) so the shared
+    HTTP session is closed when the last client is done; without that the session stays open
+    until the process exits or a later event loop replaces it.
+    """
     
     def __init__(self, api_key: str, openai_api_key: str):
         self.api_key = api_key
         self.openai_api_key = openai_api_key
         self.base_url = "https://api.firecrawl.dev/v0"
         self.session = None
-        
-        # Initialize OpenAI client with new format
-        self.openai_client = AsyncOpenAI(api_key=openai_api_key)
+        self._session_users = 0
+        # Built once and sent per request, since the session is shared between clients
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self._scrape_semaphore = None
+        self._openai_semaphore = None
+        # Upper bound on in-flight Firecrawl scrapes; raise it on plans with higher rate limits
+        self.max_concurrency = max(1, int(os.getenv("FIRECRAWL_MAX_CONCURRENCY", "8")))
+        # Opt-in: enrich validated sources with batched OpenAI analysis instead of local scoring only
+        self.openai_enrichment = os.getenv("OPENAI_ENRICHMENT", "false").lower() in ("1", "true", "yes")
+    
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """OpenAI client shared on the running event loop, keeping connections warm across reports"""
+        return _get_openai_client(self.openai_api_key)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        self.session = _get_shared_session()
+        return self.session
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-        )
+        # Nested or repeated entries, from this or any other client on the same loop, share
+        # one session; it closes when the last one exits
+        entry = _shared_session_entry()
+        entry.users += 1
+        self._session_users += 1
+        self.session = entry.session
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self._release_session(1)
+    
+    async def aclose(self):
+        """Release this client's hold on the shared HTTP session, closing it if no one else uses it"""
+        await self._release_session(self._session_users)
+    
+    async def _release_session(self, count: int):
+        count = min(count, self._session_users)
+        self._session_users -= count
+        self.session = None
+        with _shared_sessions_lock:
+            entry = _shared_sessions.get(asyncio.get_running_loop())
+        if entry is None:
+            return
+        entry.users = max(0, entry.users - count)
+        if entry.users == 0:
+            await close_shared_session()
+            await close_shared_openai_clients()
     
     async def intelligent_research_pipeline(self, query: ResearchQuery) -> Dict[str, Any]:
         """Advanced research pipeline with multiple data sources and OpenAI verification"""
         
-        print("🔍 Phase 1: Discovering comprehensive sources...")
+        logger.info("🔍 Phase 1: Discovering comprehensive sources...")
         # Enhanced source discovery with multiple strategies
         primary_sources = await self.comprehensive_source_discovery(query)
         
-        print("📊 Phase 2: Deep content extraction...")
+        logger.info("📊 Phase 2: Deep content extraction...")
         # Enhanced content extraction with better parsing
         extracted_data = await self.enhanced_content_extraction(primary_sources, query)
         
-        print("✅ Phase 3: OpenAI data validation and enrichment...")
+        logger.info("✅ Phase 3: OpenAI data validation and enrichment...")
         # Use OpenAI to validate and enrich the collected data
         validated_data = await self.openai_data_validation(extracted_data, query)
         
-        print("🏢 Phase 4: Comprehensive competitive analysis...")
-        # Enhanced competitive intelligence
-        competitive_data = await self.comprehensive_competitive_analysis(query)
-        
-        print("📈 Phase 5: Advanced trend analysis...")
-        # Advanced trend analysis with OpenAI
-        trend_analysis = await self.advanced_trend_analysis(validated_data, query)
-        
-        print("🎯 Phase 6: Data verification and fact-checking...")
-        # Use OpenAI to verify facts and data points
-        verified_data = await self.openai_fact_verification(validated_data, query)
+        # Fact-checking is the slow, network-bound phase and nothing in phases 4-5 or the
+        # credibility assessment depends on it, so start it now; the CPU-bound phases run in
+        # worker threads, which hands the loop to the verification requests meanwhile
+        verification_task = asyncio.create_task(self.openai_fact_verification(validated_data, query))
+        try:
+            logger.info("🏢 Phase 4: Comprehensive competitive analysis...")
+            # Enhanced competitive intelligence
+            competitive_data = await self.comprehensive_competitive_analysis(query)
+            
+            logger.info("📈 Phase 5: Advanced trend analysis...")
+            # Advanced trend analysis with OpenAI
+            trend_analysis = await asyncio.to_thread(self._build_trend_analysis, validated_data)
+            
+            source_credibility = await asyncio.to_thread(self._score_source_credibility, primary_sources)
+            
+            logger.info("🎯 Phase 6: Data verification and fact-checking...")
+            # Use OpenAI to verify facts and data points
+            verified_data = await verification_task
+        except BaseException:
+            verification_task.cancel()
+            raise
         
         return {
             "primary_research": verified_data,
             "competitive_intelligence": competitive_data,
             "trend_analysis": trend_analysis,
-            "data_quality_score": await self.calculate_comprehensive_quality_score(verified_data),
-            "source_credibility": await self.assess_enhanced_source_credibility(primary_sources),
+            "data_quality_score": self.calculate_comprehensive_quality_score(verified_data),
+            "source_credibility": source_credibility,
             "research_metadata": {
                 "sources_discovered": len(primary_sources),
                 "data_points_extracted": sum(len(d.get("data_points", [])) for d in verified_data),
@@ -86,97 +745,154 @@ class AdvancedFirecrawlClient:
     async def comprehensive_source_discovery(self, query: ResearchQuery) -> List[Dict[str, Any]]:
         """Enhanced source discovery with real web research"""
         
-        print("  📍 Discovering real research sources...")
+        logger.info("  📍 Discovering real research sources...")
         
         # Generate real search URLs based on the query
         search_urls = self._generate_search_urls(query)
         
+        # Real scraping rarely yields enough sources, so start the AI fallback
+        # speculatively alongside it and cancel it if scraping succeeds
+        ai_task = asyncio.create_task(self._generate_query_specific_data(query))
+        
         # Try to extract real content first
         real_sources = []
         
         try:
             # Attempt real web scraping
-            print("  🔍 Attempting real web research...")
-            real_sources = await self._perform_real_research(query, search_urls)
+            logger.info("  🔍 Attempting real web research...")
+            real_sources = self._dedupe_sources(await self._perform_real_research(query, search_urls))
             
             if real_sources and len(real_sources) >= 10:
-                print(f"  ✅ Successfully collected {len(real_sources)} real sources")
+                ai_task.cancel()
+                logger.info("  ✅ Successfully collected %s real sources", len(real_sources))
                 return real_sources
         except Exception as e:
-            print(f"  ⚠️ Real research failed: {e}")
+            logger.warning("  ⚠️ Real research failed: %s", e)
+        except BaseException:
+            ai_task.cancel()
+            raise
         
         # Only use AI-generated data as last resort with query-specific content
-        print("  🤖 Generating query-specific research data...")
-        ai_sources = await self._generate_query_specific_data(query)
+        logger.info("  🤖 Generating query-specific research data...")
+        ai_sources = self._dedupe_sources(await ai_task)
         
-        print(f"  ✅ Generated {len(ai_sources)} query-specific sources")
+        logger.info("  ✅ Generated %s query-specific sources", len(ai_sources))
         return ai_sources
     
+    @staticmethod
+    def _dedupe_sources(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop repeated sources so later phases don't enrich and verify them twice"""
+        
+        seen = set()
+        unique_sources = []
+        for source in sources:
+            # Same URL, or same title and leading findings (AI retries get fresh synthetic URLs)
+            findings = source.get("key_findings") or []
+            keys = (source.get("source_url"),
+                    (str(source.get("title", "")).lower(), tuple(map(str, findings[:3]))))
+            if any(key in seen for key in keys if key):
+                continue
+            seen.update(key for key in keys if key)
+            unique_sources.append(source)
+        return unique_sources
+    
     def _generate_search_urls(self, query: ResearchQuery) -> List[str]:
         """Generate real search URLs based on the query"""
-        
-        search_urls = []
-        
-        # Create search queries for different platforms
-        search_terms = query.topic.replace(" ", "+")
-        keywords = "+".join(query.keywords[:3])  # Use first 3 keywords
-        
-        # Investment-focused URLs
-        if any(term in query.topic.lower() for term in ["investment", "venture", "funding"]):
-            search_urls.extend([
-                f"https://www.crunchbase.com/search/funding_rounds?query={search_terms}",
-                f"https://www.techinasia.com/search?q={search_terms}",
-                f"https://e27.co/search?q={search_terms}",
-                f"https://www.dealstreetasia.com/search?q={search_terms}",
-                f"https://www.bloomberg.com/search?query={search_terms}+investment"
-            ])
-        
-        # General business research URLs
-        search_urls.extend([
-            f"https://www.reuters.com/site-search/?query={search_terms}",
-            f"https://www.mckinsey.com/search?q={search_terms}",
-            f"https://www.bcg.com/search?q={search_terms}",
-            f"https://www.statista.com/search/?q={search_terms}",
-            f"https://www.marketresearch.com/search/?query={search_terms}"
-        ])
-        
-        return search_urls[:10]  # Limit to 10 URLs to avoid overwhelming
+        return list(_search_urls_for_topic(query.topic))
     
     async def _perform_real_research(self, query: ResearchQuery, urls: List[str]) -> List[Dict[str, Any]]:
         """Perform actual web research using Firecrawl"""
         
         real_sources = []
         
-        for url in urls[:5]:  # Limit to 5 URLs for performance
-            try:
-                print(f"    🔍 Researching: {url}")
+        stream = self._stream_real_research(query, urls)
+        try:
+            async for structured_data in stream:
+                real_sources.append(structured_data)
+        finally:
+            # Closing the stream cancels scrapes that are still in flight
+            await stream.aclose()
+        
+        return real_sources
+    
+    async def _stream_real_research(self, query: ResearchQuery, urls: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield structured sources in completion order as concurrent scrapes finish"""
+        
+        urls = self._filter_scrape_urls(urls)
+        tasks = [asyncio.ensure_future(self._research_url(url, query)) for url in urls[:5]]  # Limit to 5 URLs for performance
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                structured_data = await next_result
+                if structured_data:
+                    yield structured_data
+        finally:
+            # Cancel stragglers so slow URLs don't hold the pipeline or spend credits
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    @staticmethod
+    def _filter_scrape_urls(urls: List[str], per_host_limit: int = 2) -> List[str]:
+        """Drop duplicate and non-HTML URLs and cap URLs per host to diversify sources"""
+        
+        seen = set()
+        host_counts = {}
+        filtered = []
+        for url in urls:
+            if not url:
+                continue
+            parts = urlsplit(url)
+            # Fragments never change the page; compare case-insensitively
+            key = parts._replace(fragment='').geturl().lower()
+            if key in seen or parts.path.lower().endswith(_NON_HTML_EXTENSIONS):
+                continue
+            seen.add(key)
+            
+            host = parts.netloc.lower()
+            if host_counts.get(host, 0) >= per_host_limit:
+                continue
+            host_counts[host] = host_counts.get(host, 0) + 1
+            filtered.append(url)
+        
+        return filtered
+    
+    async def _research_url(self, url: str, query: ResearchQuery) -> Optional[Dict[str, Any]]:
+        """Scrape and structure a single research URL"""
+        
+        # Created lazily so it binds to the running event loop
+        if self._scrape_semaphore is None:
+            self._scrape_semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            async with self._scrape_semaphore:
+                logger.debug("    🔍 Researching: %s", url)
                 
                 # Use Firecrawl to scrape the URL
                 result = await self.extract_comprehensive_content(url)
+            
+            if result:
+                # Process and structure the real data
+                return self._structure_real_data(ScrapedPage.from_response(url, result), query)
                 
-                if result and result.get('key_findings'):
-                    # Process and structure the real data
-                    structured_data = self._structure_real_data(result, query)
-                    if structured_data:
-                        real_sources.append(structured_data)
-                        
-            except Exception as e:
-                print(f"    ⚠️ Failed to research {url}: {e}")
-                continue
+        except Exception as e:
+            logger.warning("    ⚠️ Failed to research %s: %s", url, e)
         
-        return real_sources
+        return None
     
-    def _structure_real_data(self, raw_data: Dict[str, Any], query: ResearchQuery) -> Dict[str, Any]:
+    def _structure_real_data(self, page: ScrapedPage, query: ResearchQuery) -> Optional[Dict[str, Any]]:
         """Structure real scraped data into our format"""
         
-        if not raw_data or not raw_data.get('key_findings'):
+        if not page.key_findings:
             return None
         
+        # Sources stay plain dicts downstream; this is the only place a page becomes one
         return {
-            "title": raw_data.get('title', f"Research: {query.topic}"),
-            "source_url": raw_data.get('source_url', 'unknown'),
-            "key_findings": raw_data.get('key_findings', []),
-            "data_points": raw_data.get('data_points', []),
+            "title": page.title or f"Research: {query.topic}",
+            "source_url": page.url or 'unknown',
+            "key_findings": page.key_findings,
+            "data_points": page.data_points,
             "quality_score": 0.95,  # Real data gets higher quality score
             "ai_validated": False,
             "source_metadata": {
@@ -209,6 +925,9 @@ class AdvancedFirecrawlClient:
             
             Make the data specific to the query topic, not generic business information.
             Focus on actual insights that would help answer the research question.
+            
+            Return a JSON object: {{"sources": [{{"title": "", "key_findings": [""],
+            "data_points": [{{"metric": "", "value": "", "unit": "", "context": ""}}], "credibility": ""}}]}}
             """
             
             # Call OpenAI API to generate query-specific content
@@ -223,70 +942,40 @@ class AdvancedFirecrawlClient:
             return sources
             
         except Exception as e:
-            print(f"  ⚠️ AI research generation failed: {e}")
+            logger.warning("  ⚠️ AI research generation failed: %s", e)
             return await self.generate_fallback_research_data(query)
     
     async def _call_openai_for_research(self, prompt: str) -> str:
         """Call OpenAI API for research generation"""
         
         try:
-            import openai
-            
-            client = openai.AsyncOpenAI(api_key=self.openai_api_key)
-            
-            response = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a professional research analyst. Generate realistic, specific research data."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.7
-            )
+            # Reuse the client's pooled connections; it retries 429s and connection errors itself
+            async with self._get_openai_semaphore():
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": "You are a professional research analyst. Generate realistic, specific research data."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    response_format={"type": "json_object"},
+                    max_tokens=2000,
+                    temperature=0.7
+                )
             
             return response.choices[0].message.content
             
         except Exception as e:
-            print(f"  ⚠️ OpenAI API call failed: {e}")
+            logger.warning("  ⚠️ OpenAI API call failed: %s", e)
             return None
     
     async def _parse_openai_research_response(self, response: str, query: ResearchQuery) -> List[Dict[str, Any]]:
         """Parse OpenAI response into structured research data"""
         
-        sources = []
-        
         try:
-            # Simple parsing - in production you'd want more sophisticated parsing
-            lines = response.split('\n')
-            current_source = {}
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                if line.startswith('Title:') or line.startswith('1.') or line.startswith('Source'):
-                    if current_source:
-                        sources.append(current_source)
-                    current_source = {
-                        "title": line.replace('Title:', '').replace('1.', '').strip(),
-                        "source_url": f"ai_generated_{len(sources)}",
-                        "key_findings": [],
-                        "data_points": [],
-                        "quality_score": 0.80,
-                        "ai_validated": True,
-                        "source_metadata": {
-                            "category": "ai_research",
-                            "priority": "medium",
-                            "discovery_method": "ai_generation"
-                        }
-                    }
-                elif line.startswith('-') or line.startswith('•'):
-                    if current_source:
-                        current_source["key_findings"].append(line.lstrip('- •').strip())
-            
-            if current_source:
-                sources.append(current_source)
+            sources = self._parse_json_research_sources(response)
+            if sources is None:
+                # Not the requested JSON shape; salvage what the line parser can
+                sources = self._parse_research_lines(response)
             
             # Ensure we have at least some sources
             if not sources:
@@ -295,22 +984,87 @@ class AdvancedFirecrawlClient:
             return sources[:15]  # Limit to 15 sources
             
         except Exception as e:
-            print(f"  ⚠️ Failed to parse OpenAI response: {e}")
+            logger.warning("  ⚠️ Failed to parse OpenAI response: %s", e)
             return await self.generate_fallback_research_data(query)
     
+    @staticmethod
+    def _ai_research_source(title: str, index: int) -> Dict[str, Any]:
+        """Empty AI-generated source record, filled in by the response parsers"""
+        return {
+            "title": title,
+            "source_url": f"ai_generated_{index}",
+            "key_findings": [],
+            "data_points": [],
+            "quality_score": 0.80,
+            "ai_validated": True,
+            "source_metadata": {
+                "category": "ai_research",
+                "priority": "medium",
+                "discovery_method": "ai_generation"
+            }
+        }
+    
+    def _parse_json_research_sources(self, response: str) -> Optional[List[Dict[str, Any]]]:
+        """Build sources from a JSON-mode response, or None if it isn't {"sources": [...]}"""
+        try:
+            payload = _json_loads(response)
+        except ValueError:
+            return None
+        entries = payload.get("sources") if isinstance(payload, dict) else None
+        if not isinstance(entries, list):
+            return None
+        
+        sources = []
+        for entry in entries[:15]:
+            if not isinstance(entry, dict) or not entry.get("title"):
+                continue
+            source = self._ai_research_source(str(entry["title"]).strip(), len(sources))
+            source["key_findings"] = [str(f).strip() for f in entry.get("key_findings") or [] if f]
+            source["data_points"] = [p for p in entry.get("data_points") or [] if isinstance(p, dict)]
+            sources.append(source)
+        return sources
+    
+    def _parse_research_lines(self, response: str) -> List[Dict[str, Any]]:
+        """Line-by-line parser for free-text research responses"""
+        
+        sources = []
+        current_source = {}
+        
+        for line in response.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            
+            header = _RESEARCH_HEADER_RE.match(line)
+            if header:
+                if current_source:
+                    sources.append(current_source)
+                current_source = self._ai_research_source(header.group(1).strip(), len(sources))
+            elif current_source:
+                bullet = _RESEARCH_BULLET_RE.match(line)
+                if bullet:
+                    current_source["key_findings"].append(bullet.group(1))
+        
+        if current_source:
+            sources.append(current_source)
+        
+        return sources
+    
     async def enhanced_content_extraction(self, sources: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
         """Enhanced content extraction - processes comprehensive sources directly"""
         
-        print(f"  📄 Processing {len(sources)} comprehensive research sources...")
+        logger.info("  📄 Processing %s comprehensive research sources...", len(sources))
         
         # Since our comprehensive sources already contain all the data we need,
         # we don't need to scrape them - just process them directly
         processed_sources = []
+        # One timestamp per phase; it tags the batch, not individual items
+        extracted_at = datetime.now().isoformat()
         
         for i, source in enumerate(sources):
             try:
                 # Add processing metadata
-                source["extraction_timestamp"] = datetime.now().isoformat()
+                source["extraction_timestamp"] = extracted_at
                 source["processing_status"] = "processed"
                 
                 # Ensure required fields exist
@@ -325,256 +1079,122 @@ class AdvancedFirecrawlClient:
                 
                 # Progress indicator
                 if (i + 1) % 10 == 0:
-                    print(f"    ✅ Processed {i + 1}/{len(sources)} sources")
+                    logger.debug("    ✅ Processed %s/%s sources", i + 1, len(sources))
                 
             except Exception as e:
-                print(f"    ⚠️ Error processing source {i+1}: {e}")
+                logger.warning("    ⚠️ Error processing source %s: %s", i+1, e)
                 continue
         
-        print(f"  ✅ Successfully processed {len(processed_sources)} comprehensive sources")
+        logger.info("  ✅ Successfully processed %s comprehensive sources", len(processed_sources))
         return processed_sources
     
     async def extract_comprehensive_content(self, url: str) -> Dict[str, Any]:
         """Extract comprehensive content with enhanced schema"""
         
-        # More comprehensive extraction schema
-        extraction_schema = {
-            "type": "object",
-            "properties": {
-                "title": {"type": "string"},
-                "authors": {"type": "array", "items": {"type": "string"}},
-                "publication_date": {"type": "string"},
-                "abstract": {"type": "string"},
-                "executive_summary": {"type": "string"},
-                "key_findings": {"type": "array", "items": {"type": "string"}},
-                "methodology": {"type": "string"},
-                "data_points": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "metric": {"type": "string"},
-                            "value": {"type": "string"},
-                            "unit": {"type": "string"},
-                            "context": {"type": "string"},
-                            "source": {"type": "string"},
-                            "date": {"type": "string"}
-                        }
-                    }
-                },
-                "financial_data": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "company": {"type": "string"},
-                            "metric": {"type": "string"},
-                            "value": {"type": "string"},
-                            "period": {"type": "string"}
-                        }
-                    }
-                },
-                "investment_data": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "company": {"type": "string"},
-                            "investor": {"type": "string"},
-                            "amount": {"type": "string"},
-                            "date": {"type": "string"},
-                            "round_type": {"type": "string"},
-                            "sector": {"type": "string"}
-                        }
-                    }
-                },
-                "market_analysis": {
-                    "type": "object",
-                    "properties": {
-                        "market_size": {"type": "string"},
-                        "growth_rate": {"type": "string"},
-                        "key_players": {"type": "array", "items": {"type": "string"}},
-                        "trends": {"type": "array", "items": {"type": "string"}}
-                    }
-                },
-                "tables": {"type": "array", "items": {"type": "object"}},
-                "charts": {"type": "array", "items": {"type": "object"}},
-                "conclusions": {"type": "array", "items": {"type": "string"}},
-                "references": {"type": "array", "items": {"type": "string"}},
-                "contact_information": {
-                    "type": "object",
-                    "properties": {
-                        "company": {"type": "string"},
-                        "email": {"type": "string"},
-                        "phone": {"type": "string"},
-                        "address": {"type": "string"}
-                    }
-                }
-            }
-        }
-        
-        scrape_params = {
-            "url": url,
-            "formats": ["markdown", "html"],
-            "onlyMainContent": True,
-            "waitFor": 3000,  # Wait longer for dynamic content
-            "extract": {"schema": extraction_schema},
-            "timeout": 30000  # 30 second timeout
-        }
-        
-        try:
-            async with self.session.post(f"{self.base_url}/scrape", json=scrape_params) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    
-                    # Add URL to the result for reference
-                    if result:
-                        result["source_url"] = url
-                        result["extraction_timestamp"] = datetime.now().isoformat()
-                    
-                    return result
-                else:
-                    print(f"Failed to scrape {url}: HTTP {response.status}")
+        cached = _scrape_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < _SCRAPE_CACHE_TTL:
+            _scrape_cache.move_to_end(url)
+            return dict(cached[1])
+        
+        body = self._scrape_body(url)
+        # The request body covers the URL, schema and options, so a schema change misses the cache
+        cache_key = hashlib.blake2b(body, digest_size=16).hexdigest()
+        
+        cached_body = await asyncio.to_thread(_disk_cache_get, "scrape_cache", cache_key, _SCRAPE_CACHE_TTL)
+        if cached_body is not None:
+            result = _json_loads(cached_body)
+            self._remember_scrape(url, result)
+            return dict(result)
+        
+        deadline = time.monotonic() + _SCRAPE_DEADLINE
+        for attempt in range(_SCRAPE_ATTEMPTS):
+            backoff = 0.2 * 2 ** attempt if attempt else 0.0
+            if deadline - time.monotonic() - backoff < _SCRAPE_MIN_ATTEMPT:
+                break  # The URL's budget is spent
+            if backoff:
+                # Back off before retrying a transient failure
+                await asyncio.sleep(backoff)
+            remaining = deadline - time.monotonic()
+            
+            try:
+                # Session headers apply; each attempt only gets what is left of the URL's deadline,
+                # and release returns the connection to the pool
+                timeout = aiohttp.ClientTimeout(total=remaining, connect=5, sock_read=min(35, remaining))
+                response = await self._get_session().post(f"{self.base_url}/scrape", data=body,
+                                                          headers=self._headers, timeout=timeout)
+                try:
+                    if response.status == 200:
+                        # Scrapes carry large markdown bodies; orjson parses them much faster,
+                        # and big ones are decoded off the event loop so other scrapes keep moving
+                        raw = await response.read()
+                        if len(raw) > _LARGE_BODY_BYTES:
+                            result = await asyncio.to_thread(_json_loads, raw)
+                        else:
+                            result = _json_loads(raw)
+                        
+                        # Add URL to the result for reference
+                        if result:
+                            self._trim_scraped_markdown(result)
+                            result["source_url"] = url
+                            result["extraction_timestamp"] = datetime.now().isoformat()
+                            
+                            self._remember_scrape(url, result)
+                            await asyncio.to_thread(_disk_cache_put, "scrape_cache", cache_key, _json_dumps(result))
+                            return dict(result)
+                        
+                        return result
                     
-        except Exception as e:
-            print(f"Error extracting comprehensive content from {url}: {e}")
+                    logger.warning("Failed to scrape %s: HTTP %s", url, response.status)
+                    if response.status < 500:
+                        break  # Client errors won't succeed on retry
+                finally:
+                    response.release()
+                
+            except (aiohttp.ClientConnectorError, asyncio.TimeoutError) as e:
+                logger.debug("Network or timeout error scraping %s (attempt %d/%d): %r", url, attempt + 1, _SCRAPE_ATTEMPTS, e)
+            except Exception as e:
+                logger.warning("Error extracting comprehensive content from %s: %s", url, e)
+                break
         
         return {}
     
+    @staticmethod
+    def _remember_scrape(url: str, result: Dict[str, Any]):
+        """Keep a scrape result in the in-process LRU"""
+        _scrape_cache[url] = (time.monotonic(), result)
+        _scrape_cache.move_to_end(url)
+        if len(_scrape_cache) > _SCRAPE_CACHE_SIZE:
+            _scrape_cache.popitem(last=False)
+    
+    @staticmethod
+    def _scrape_body(url: str) -> bytes:
+        """Serialize a scrape request by splicing the URL in front of the pre-encoded options"""
+        return b'{"url":' + _json_dumps(url) + b',' + _SCRAPE_BODY_TAIL
+    
+    @staticmethod
+    def _trim_scraped_markdown(result: Dict[str, Any]):
+        """Collapse blank-line runs and cap page markdown so cached scrapes stay small"""
+        page = result.get("data")
+        if isinstance(page, dict):
+            markdown = page.get("markdown")
+            if isinstance(markdown, str):
+                page["markdown"] = _BLANK_LINES_RE.sub("\n\n", markdown)[:_MAX_MARKDOWN_CHARS]
+    
     async def generate_fallback_research_data(self, query: ResearchQuery) -> List[Dict[str, Any]]:
         """Generate fallback research data when scraping fails"""
         
-        fallback_sources = []
-        
-        # Generate synthetic but realistic data based on the query topic
-        if "anthill ventures" in query.topic.lower():
-            # Create realistic investment data for Anthill Ventures
-            fallback_sources.append({
-                "title": "Anthill Ventures Investment Portfolio Analysis",
-                "source_url": "synthetic_data_anthill_ventures",
-                "key_findings": [
-                    "Anthill Ventures focuses primarily on early-stage B2B SaaS companies",
-                    "Average investment size ranges from $500K to $2M in seed rounds",
-                    "Portfolio companies show 80% survival rate after 3 years",
-                    "Key sectors include fintech, healthtech, and enterprise software",
-                    "Geographic focus on Southeast Asia and India markets"
-                ],
-                "investment_data": [
-                    {
-                        "company": "TechFlow Solutions",
-                        "investor": "Anthill Ventures",
-                        "amount": "$1.2M",
-                        "date": "2024-Q1",
-                        "round_type": "Seed",
-                        "sector": "Enterprise SaaS"
-                    },
-                    {
-                        "company": "HealthMetrics AI",
-                        "investor": "Anthill Ventures",
-                        "amount": "$800K",
-                        "date": "2024-Q2",
-                        "round_type": "Pre-Seed",
-                        "sector": "HealthTech"
-                    },
-                    {
-                        "company": "FinanceCore",
-                        "investor": "Anthill Ventures",
-                        "amount": "$1.5M",
-                        "date": "2023-Q4",
-                        "round_type": "Seed",
-                        "sector": "FinTech"
-                    },
-                    {
-                        "company": "DataBridge Analytics",
-                        "investor": "Anthill Ventures",
-                        "amount": "$900K",
-                        "date": "2024-Q1",
-                        "round_type": "Seed",
-                        "sector": "Data Analytics"
-                    },
-                    {
-                        "company": "CloudOps Pro",
-                        "investor": "Anthill Ventures",
-                        "amount": "$1.1M",
-                        "date": "2024-Q2",
-                        "round_type": "Seed",
-                        "sector": "DevOps"
-                    }
-                ],
-                "market_analysis": {
-                    "market_size": "$45B Southeast Asian startup ecosystem",
-                    "growth_rate": "25% YoY in early-stage investments",
-                    "key_players": ["Anthill Ventures", "Alpha JWC", "Golden Gate Ventures", "Sequoia Capital SEA"],
-                    "trends": [
-                        "Increasing focus on B2B SaaS solutions",
-                        "Growing interest in AI-powered startups",
-                        "Expansion into emerging markets",
-                        "Higher average deal sizes in 2024"
-                    ]
-                },
-                "data_points": [
-                    {
-                        "metric": "Portfolio Size",
-                        "value": "45",
-                        "unit": "companies",
-                        "context": "Active portfolio companies as of 2024",
-                        "source": "Anthill Ventures website",
-                        "date": "2024"
-                    },
-                    {
-                        "metric": "Average Investment",
-                        "value": "1.1",
-                        "unit": "million USD",
-                        "context": "Typical seed round investment size",
-                        "source": "Investment analysis",
-                        "date": "2024"
-                    }
-                ],
-                "quality_score": 0.85,
-                "ai_validated": False,
-                "source_metadata": {
-                    "category": "investment_data",
-                    "priority": "high",
-                    "discovery_method": "fallback_generation"
-                }
-            })
+        # Topic-specific synthetic sources first, e.g. investment data for Anthill Ventures
+        topic = query.topic.lower()
+        fallback_sources = [dict(source) for key, source in _FALLBACK_REGISTRY.items() if key in topic]
         
         # Add general market research data
         fallback_sources.append({
             "title": f"Market Research: {query.topic}",
-            "source_url": "synthetic_market_research",
+            **_MARKET_FALLBACK_SOURCE,
             "key_findings": [
                 f"Market shows strong growth potential in {query.topic} sector",
-                "Increasing investor interest in early-stage opportunities",
-                "Technology adoption driving market expansion",
-                "Regulatory environment becoming more favorable",
-                "Competition intensifying among established players"
-            ],
-            "data_points": [
-                {
-                    "metric": "Market Growth Rate",
-                    "value": "22",
-                    "unit": "percent",
-                    "context": "Year-over-year growth in investment volume",
-                    "source": "Market analysis",
-                    "date": "2024"
-                },
-                {
-                    "metric": "Investment Volume",
-                    "value": "2.8",
-                    "unit": "billion USD",
-                    "context": "Total investment in sector for 2024",
-                    "source": "Industry reports",
-                    "date": "2024"
-                }
-            ],
-            "quality_score": 0.75,
-            "ai_validated": False,
-            "source_metadata": {
-                "category": "market_research",
-                "priority": "medium",
-                "discovery_method": "fallback_generation"
-            }
+                *_MARKET_FALLBACK_SOURCE["key_findings"]
+            ]
         })
         
         return fallback_sources
@@ -582,172 +1202,201 @@ class AdvancedFirecrawlClient:
     async def openai_data_validation(self, extracted_data: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
         """Use OpenAI to validate and enrich extracted data"""
         
-        validated_data = []
-        
-        print(f"    🔍 Validating {len(extracted_data)} research sources...")
-        
-        for i, data in enumerate(extracted_data):
-            if self._is_valid_data(data):
-                try:
-                    # Since our comprehensive sources are already high-quality,
-                    # we can do basic enrichment without expensive OpenAI calls
-                    enriched_data = await self._basic_enrich_data(data)
-                    
-                    # Add validation metadata
-                    enriched_data["validation_status"] = "validated"
-                    enriched_data["validation_timestamp"] = datetime.now().isoformat()
-                    
-                    validated_data.append(enriched_data)
-                    
-                    # Progress indicator
-                    if (i + 1) % 15 == 0:
-                        print(f"      ✅ Validated {i + 1}/{len(extracted_data)} sources")
-                    
-                except Exception as e:
-                    print(f"      ⚠️ Error validating source {i+1}: {e}")
-                    # Still include the data even if validation fails
-                    data["validation_status"] = "basic"
-                    validated_data.append(data)
-        
-        print(f"  ✅ Validated and enriched {len(validated_data)} data sources")
+        logger.info("    🔍 Validating %s research sources...", len(extracted_data))
+        validated_at = datetime.now().isoformat()
+        
+        if self.openai_enrichment:
+            # One request per batch of _ENRICH_BATCH_SIZE sources, dispatched concurrently and
+            # bounded by the shared OpenAI semaphore; sources the model can't analyze fall back
+            # to the basic quality score inside the batch
+            candidates = [data for data in extracted_data if self._is_valid_data(data)]
+            validated_data = await self._openai_enrich_sources(candidates, query)
+            for data in validated_data:
+                data["processing_timestamp"] = validated_at
+                data["validation_status"] = "validated"
+                data["validation_timestamp"] = validated_at
+        else:
+            validated_data = [self._validate_source(i, data, validated_at)
+                              for i, data in enumerate(extracted_data) if self._is_valid_data(data)]
+        
+        logger.info("  ✅ Validated and enriched %s data sources", len(validated_data))
         return validated_data
     
+    def _validate_source(self, i: int, data: Dict[str, Any], validated_at: str) -> Dict[str, Any]:
+        """Enrich and tag a single source for openai_data_validation"""
+        try:
+            # Since our comprehensive sources are already high-quality,
+            # we can do basic enrichment without expensive OpenAI calls
+            enriched_data = self._basic_enrich_data(data, validated_at)
+        except Exception as e:
+            logger.warning("      ⚠️ Error validating source %s: %s", i+1, e)
+            # Still include the data even if validation fails
+            data["validation_status"] = "basic"
+            return data
+        
+        # Add validation metadata
+        enriched_data["validation_status"] = "validated"
+        enriched_data["validation_timestamp"] = validated_at
+        return enriched_data
+    
+    def _get_openai_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent OpenAI requests, created on first use"""
+        # Created lazily so it binds to the running event loop
+        if self._openai_semaphore is None:
+            self._openai_semaphore = asyncio.Semaphore(_OPENAI_CONCURRENCY)
+        return self._openai_semaphore
+    
     async def _openai_enrich_data(self, data: Dict[str, Any], query: ResearchQuery) -> Dict[str, Any]:
         """Use OpenAI to enrich and validate data"""
+        return (await self._openai_enrich_batch([data], query))[0]
+    
+    async def _openai_enrich_sources(self, sources: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
+        """Enrich many sources with one OpenAI call per batch of _ENRICH_BATCH_SIZE"""
+        # Batches are gathered together; _cached_completion holds the OpenAI semaphore per request
+        batches = [sources[i:i + _ENRICH_BATCH_SIZE] for i in range(0, len(sources), _ENRICH_BATCH_SIZE)]
+        results = await asyncio.gather(*(self._openai_enrich_batch(batch, query) for batch in batches))
+        return [data for batch in results for data in batch]
+    
+    async def _openai_enrich_batch(self, batch: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
+        """Use OpenAI to enrich and validate several sources, escalating weak answers to a larger model"""
+        
+        analyses = await self._request_enrichment(_ENRICH_MODEL, batch, query)
+        models = [_ENRICH_MODEL] * len(batch)
+        
+        # Cascade: only unparseable or low-confidence answers are re-asked of the larger model
+        escalate = [i for i, analysis in enumerate(analyses)
+                    if analysis is None or analysis["quality_score"] < _ENRICH_ESCALATE_BELOW]
+        if escalate:
+            logger.info("      🔁 Re-asking %s of %s sources with %s", len(escalate), len(batch), _ENRICH_FALLBACK_MODEL)
+            retried = await self._request_enrichment(_ENRICH_FALLBACK_MODEL, [batch[i] for i in escalate], query)
+            for i, analysis in zip(escalate, retried):
+                if analysis is not None:
+                    analyses[i] = analysis
+                    models[i] = _ENRICH_FALLBACK_MODEL
+        
+        for data, openai_analysis, model in zip(batch, analyses, models):
+            if openai_analysis is not None:
+                # Enrich original data with OpenAI analysis
+                openai_analysis["model"] = model
+                data["openai_analysis"] = openai_analysis
+                data["quality_score"] = openai_analysis["quality_score"] / 10.0
+                data["relevance_score"] = self._coerce_score(openai_analysis.get("relevance_score", 5)) / 10.0
+                data["ai_validated"] = True
+            else:
+                data["ai_validated"] = False
+                data["quality_score"] = self._calculate_basic_quality_score(data)
+        
+        return batch
+    
+    async def _request_enrichment(self, model: str, batch: List[Dict[str, Any]],
+                                  query: ResearchQuery) -> List[Optional[Dict[str, Any]]]:
+        """Ask one model to analyze a batch; entries that fail validation come back as None"""
         
         system_prompt = """You are a professional research analyst. Your task is to analyze and enrich research data.
         Extract the most important information, verify data quality, and identify key insights.
         Focus on factual accuracy and business relevance."""
         
-        user_prompt = f"""
-        Research Topic: {query.topic}
-        Keywords: {', '.join(query.keywords)}
-        
-        Analyze this research data and provide enrichment:
-        
+        sources_text = "\n".join(
+            f"""
+        Source {i}:
         Title: {data.get('title', 'N/A')}
         Key Findings: {data.get('key_findings', [])}
         Data Points: {data.get('data_points', [])}
         Investment Data: {data.get('investment_data', [])}
-        Market Analysis: {data.get('market_analysis', {})}
+        Market Analysis: {data.get('market_analysis', {})}"""
+            for i, data in enumerate(batch, 1)
+        )
         
-        Please provide:
+        user_prompt = f"""
+        Research Topic: {query.topic}
+        Keywords: {', '.join(query.keywords)}
+        
+        Analyze each of these {len(batch)} research sources and provide enrichment:
+        {sources_text}
+        
+        For each source provide:
         1. Data quality assessment (score 1-10)
         2. Key insights extracted
         3. Relevance to research topic (score 1-10)
         4. Any data validation concerns
         5. Additional context or interpretation
         
-        Format as JSON with keys: quality_score, key_insights, relevance_score, validation_concerns, additional_context
+        Format as a JSON object {{"sources": [...]}} holding one object per source, in the order given, each with keys:
+        quality_score, key_insights, relevance_score, validation_concerns, additional_context
         """
         
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
+            content = await self._cached_completion(
+                model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
+                response_format={"type": "json_object"},
                 temperature=0.2,
-                max_tokens=1000
+                max_tokens=400 * len(batch)  # Each analysis is a small JSON object
             )
             
-            openai_analysis = json.loads(response.choices[0].message.content)
-            
-            # Enrich original data with OpenAI analysis
-            data["openai_analysis"] = openai_analysis
-            data["quality_score"] = openai_analysis.get("quality_score", 5) / 10.0
-            data["relevance_score"] = openai_analysis.get("relevance_score", 5) / 10.0
-            data["ai_validated"] = True
-            
+            analyses = _json_loads(content).get("sources", [])
         except Exception as e:
-            print(f"OpenAI enrichment failed: {e}")
-            data["ai_validated"] = False
-            data["quality_score"] = self._calculate_basic_quality_score(data)
+            logger.warning("OpenAI enrichment failed (%s): %s", model, e)
+            analyses = []
         
-        return data
+        if not isinstance(analyses, list):
+            analyses = []
+        
+        validated = []
+        for i in range(len(batch)):
+            analysis = analyses[i] if i < len(analyses) else None
+            try:
+                # Numeric strings count as scores; anything unparseable is left for the cascade
+                analysis["quality_score"] = min(max(float(analysis["quality_score"]), 0.0), 10.0)
+                validated.append(analysis)
+            except (TypeError, ValueError, KeyError):
+                validated.append(None)
+        return validated
     
-    async def _basic_enrich_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _basic_enrich_data(self, data: Dict[str, Any], timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Basic data enrichment without OpenAI"""
-        data["processing_timestamp"] = datetime.now().isoformat()
+        data["processing_timestamp"] = timestamp or datetime.now().isoformat()
         data["quality_score"] = self._calculate_basic_quality_score(data)
         data["ai_validated"] = False
         return data
     
     def _calculate_basic_quality_score(self, data: Dict[str, Any]) -> float:
         """Calculate basic quality score for data point"""
-        score = 0.0
-        
-        # Check for key fields with weighted scoring
-        if data.get("title"): score += 0.15
-        if data.get("authors"): score += 0.1
-        if data.get("publication_date"): score += 0.1
-        if data.get("key_findings"): score += 0.25
-        if data.get("methodology"): score += 0.1
-        if data.get("data_points"): score += 0.15
-        if data.get("investment_data"): score += 0.1
-        if data.get("market_analysis"): score += 0.05
-        
-        return min(score, 1.0)
+        # Pack which key fields are present into a bitmask and look the weighted score up
+        mask = 0
+        for bit, field in enumerate(_QUALITY_FIELDS):
+            if data.get(field):
+                mask |= 1 << bit
+        return _QUALITY_SCORE_LUT[mask]
     
     async def comprehensive_competitive_analysis(self, query: ResearchQuery) -> Dict[str, Any]:
         """Enhanced competitive intelligence - fast local processing"""
         
-        print("    🏢 Processing competitive intelligence data...")
+        logger.info("    🏢 Processing competitive intelligence data...")
         
-        # Generate comprehensive competitive data locally instead of slow API calls
-        competitive_data = {
-            "competitors": [
-                "Sequoia Capital SEA - Leading VC with $2.5B AUM, 150+ portfolio companies",
-                "Golden Gate Ventures - Early-stage focused, $100M+ deployed, 80+ investments",
-                "Alpha JWC - B2B SaaS specialist, $75M fund, 60+ portfolio companies",
-                "500 Startups - Global accelerator, 2,000+ companies, strong SEA presence",
-                "Monk's Hill Ventures - Enterprise tech focus, $50M+ invested, 40+ deals"
-            ],
-            "market_positioning": {
-                "anthill_ventures": {
-                    "position": "Early-stage B2B SaaS specialist",
-                    "avg_check_size": "$1.1M",
-                    "portfolio_size": "45+ companies",
-                    "geographic_focus": "Southeast Asia + India"
-                },
-                "market_share": "8.5% of early-stage deals in SEA",
-                "competitive_advantage": "Deep sector expertise in B2B SaaS and enterprise tech"
-            },
-            "pricing_analysis": {
-                "average_valuations": {
-                    "pre_seed": "$2-5M",
-                    "seed": "$8-15M", 
-                    "series_a": "$25-50M"
-                },
-                "deal_sizes": {
-                    "anthill_ventures": "$500K-2M",
-                    "market_average": "$800K-1.8M"
-                }
-            },
-            "product_comparison": {
-                "investment_focus": "B2B SaaS, Enterprise Software, FinTech, HealthTech",
-                "stage_preference": "Seed to Series A",
-                "value_add": "Operational support, market expansion, technical guidance"
-            },
-            "sources_analyzed": 25
-        }
+        # Competitive data is query-independent; shallow copy of the prebuilt payload
+        competitive_data = dict(_COMPETITIVE_DATA)
         
-        print("    ✅ Competitive analysis completed")
+        logger.info("    ✅ Competitive analysis completed")
         return competitive_data
     
     async def advanced_trend_analysis(self, validated_data: List[Dict[str, Any]], query: ResearchQuery) -> Dict[str, Any]:
         """Advanced trend analysis - fast local processing"""
+        return self._build_trend_analysis(validated_data)
+    
+    def _build_trend_analysis(self, validated_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Synchronous body of advanced_trend_analysis, safe to run in a worker thread"""
         
-        print("    📈 Processing trend analysis...")
-        
-        # Extract trends from our comprehensive data
-        all_findings = []
-        all_data_points = []
+        logger.info("    📈 Processing trend analysis...")
         
-        for data in validated_data[:20]:  # Process first 20 for speed
-            all_findings.extend(data.get("key_findings", []))
-            all_data_points.extend(data.get("data_points", []))
+        # Extract trends from our comprehensive data, classifying findings as they are streamed
+        # from the first 20 sources (for speed) rather than concatenating them first
+        growth_indicators, market_shifts, technology_trends = self._extract_all_trends(
+            finding for data in validated_data[:20] for finding in data.get("key_findings", [])
+        )
         
         # Generate comprehensive trend analysis locally
         trend_analysis = {
@@ -769,69 +1418,79 @@ class AdvancedFirecrawlClient:
                 "Remote-first business models gaining traction",
                 "Regulatory technology (RegTech) emerging as key sector"
             ],
-            "growth_indicators": self._extract_growth_indicators(all_findings),
-            "market_shifts": self._extract_market_shifts(all_findings),
-            "technology_trends": self._extract_tech_trends(all_findings),
+            "growth_indicators": growth_indicators,
+            "market_shifts": market_shifts,
+            "technology_trends": technology_trends,
             "ai_analysis_completed": True,
             "data_sources_analyzed": len(validated_data)
         }
         
-        print("    ✅ Trend analysis completed")
+        logger.info("    ✅ Trend analysis completed")
         return trend_analysis
     
-    def _extract_growth_indicators(self, findings: List[str]) -> List[str]:
-        """Extract growth indicators from findings"""
-        growth_indicators = []
-        growth_keywords = ['growth', 'increase', 'rising', 'expanding', 'surge', 'boom', 'uptick']
+    def _extract_all_trends(self, findings: Iterable[str]) -> Tuple[List[str], List[str], List[str]]:
+        """Classify findings into growth indicators, market shifts and technology trends in one pass"""
+        growth_indicators, shift_indicators, tech_trends = [], [], []
         
         for finding in findings:
-            if any(keyword in finding.lower() for keyword in growth_keywords):
+            lowered = finding.lower()  # Once per finding, shared by all three buckets
+            if len(growth_indicators) < 15 and _GROWTH_RE.search(lowered):
                 growth_indicators.append(finding)
-        
-        return growth_indicators[:15]  # Limit results
-    
-    def _extract_market_shifts(self, findings: List[str]) -> List[str]:
-        """Extract market shift indicators"""
-        shift_indicators = []
-        shift_keywords = ['shift', 'change', 'transition', 'move', 'pivot', 'transformation', 'evolution']
-        
-        for finding in findings:
-            if any(keyword in finding.lower() for keyword in shift_keywords):
+            if len(shift_indicators) < 10 and _SHIFT_RE.search(lowered):
                 shift_indicators.append(finding)
-        
-        return shift_indicators[:10]
-    
-    def _extract_tech_trends(self, findings: List[str]) -> List[str]:
-        """Extract technology trend indicators"""
-        tech_trends = []
-        tech_keywords = ['ai', 'artificial intelligence', 'machine learning', 'automation', 'digital', 'technology', 'innovation']
-        
-        for finding in findings:
-            if any(keyword in finding.lower() for keyword in tech_keywords):
+            if len(tech_trends) < 10 and _TECH_RE.search(lowered):
                 tech_trends.append(finding)
+            if len(growth_indicators) == 15 and len(shift_indicators) == 10 and len(tech_trends) == 10:
+                break  # Every bucket is full
         
-        return tech_trends[:10]
+        return growth_indicators, shift_indicators, tech_trends
     
     async def openai_fact_verification(self, validated_data: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
         """Use OpenAI to verify facts and data consistency"""
         
-        verified_data = []
+        # Verify batches concurrently; the OpenAI semaphore caps requests in flight and
+        # the client's retries absorb rate limits, so no fixed sleep between calls is needed
+        results = await asyncio.gather(*(self._verify_batch(batch, query)
+                                         for batch in self._verification_batches(validated_data)))
+        return [data for batch in results for data in batch]
+    
+    @staticmethod
+    def _verification_batches(validated_data: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split sources into groups of _VERIFY_BATCH_SIZE"""
+        return [validated_data[i:i + _VERIFY_BATCH_SIZE] for i in range(0, len(validated_data), _VERIFY_BATCH_SIZE)]
+    
+    async def _verify_batch(self, batch: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
+        """Fact-check several sources in one request, re-checking individually any the batch answer missed"""
+        if len(batch) == 1:
+            return [await self._verify_and_tag(batch[0], query)]
         
-        for data in validated_data:
-            try:
-                # Use OpenAI for fact verification
-                verification_result = await self._verify_data_with_openai(data, query)
-                data["fact_verification"] = verification_result
-                data["verification_completed"] = True
-                
-            except Exception as e:
-                print(f"Fact verification failed: {e}")
-                data["verification_completed"] = False
-            
-            verified_data.append(data)
-            await asyncio.sleep(0.3)  # Rate limiting
+        try:
+            verifications = await self._verify_batch_with_openai(batch, query)
+        except Exception as e:
+            logger.warning("Batch fact verification failed: %s", e)
+            verifications = [None] * len(batch)
         
-        return verified_data
+        retry = []
+        for data, verification in zip(batch, verifications):
+            if verification is not None:
+                data["fact_verification"] = verification
+                data["verification_completed"] = True
+            else:
+                retry.append(self._verify_and_tag(data, query))
+        if retry:
+            await asyncio.gather(*retry)
+        return batch
+    
+    async def _verify_and_tag(self, data: Dict[str, Any], query: ResearchQuery) -> Dict[str, Any]:
+        """Fact-check one source and record the outcome on it"""
+        try:
+            # Use OpenAI for fact verification
+            data["fact_verification"] = await self._verify_data_with_openai(data, query)
+            data["verification_completed"] = True
+        except Exception as e:
+            logger.warning("Fact verification failed: %s", e)
+            data["verification_completed"] = False
+        return data
     
     async def _verify_data_with_openai(self, data: Dict[str, Any], query: ResearchQuery) -> Dict[str, Any]:
         """Verify data accuracy using OpenAI"""
@@ -857,69 +1516,154 @@ class AdvancedFirecrawlClient:
         Format as JSON: {{"accuracy_assessment": "", "consistency_check": "", "reliability_score": 0, "currency_assessment": "", "credibility_score": 0, "concerns": []}}
         """
         
-        response = await self.openai_client.chat.completions.create(
+        content = await self._cached_completion(
             model="gpt-3.5-turbo",  # Use cheaper model for verification
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
+            response_format={"type": "json_object"},
             temperature=0.1,
             max_tokens=800
         )
         
-        return json.loads(response.choices[0].message.content)
+        return self._coerce_verification(_json_loads(content))
+    
+    async def _verify_batch_with_openai(self, batch: List[Dict[str, Any]],
+                                        query: ResearchQuery) -> List[Optional[Dict[str, Any]]]:
+        """Verify a batch of sources in one OpenAI call; entries that fail validation come back as None"""
+        
+        system_prompt = """You are a fact-checking expert. Analyze the provided data for accuracy, consistency, and reliability.
+        Identify any potential inconsistencies, outdated information, or questionable claims."""
+        
+        sources_text = "\n".join(
+            f"""
+        Source {i}:
+        URL: {data.get('source_url', 'Unknown')}
+        Title: {data.get('title', 'N/A')}
+        Key Claims: {data.get('key_findings', [])[:5]}
+        Data Points: {data.get('data_points', [])}"""
+            for i, data in enumerate(batch, 1)
+        )
+        
+        user_prompt = f"""
+        Verify each of these {len(batch)} research sources for accuracy and consistency:
+        {sources_text}
+        
+        For each source assess:
+        1. Factual accuracy (any obvious errors?)
+        2. Data consistency (do numbers add up?)
+        3. Source reliability (based on URL and content)
+        4. Currency of information (how recent?)
+        5. Overall credibility score (1-10)
+        
+        Format as a JSON object {{"verifications": [...]}} holding one object per source, in the order given, each with keys:
+        accuracy_assessment, consistency_check, reliability_score, currency_assessment, credibility_score, concerns
+        """
+        
+        content = await self._cached_completion(
+            model="gpt-3.5-turbo",  # Use cheaper model for verification
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1,
+            max_tokens=400 * len(batch)  # Each verdict is a small JSON object
+        )
+        
+        verifications = _json_loads(content).get("verifications", [])
+        if not isinstance(verifications, list):
+            verifications = []
+        
+        validated = []
+        for i in range(len(batch)):
+            try:
+                validated.append(self._coerce_verification(verifications[i]) if i < len(verifications) else None)
+            except ValueError:
+                validated.append(None)
+        return validated
+    
+    @classmethod
+    def _coerce_verification(cls, result: Any) -> Dict[str, Any]:
+        """Normalize a verification verdict so downstream scoring can index it safely"""
+        if not isinstance(result, dict):
+            raise ValueError(f"expected a JSON object, got {type(result).__name__}")
+        
+        for key in ("reliability_score", "credibility_score"):
+            result[key] = cls._coerce_score(result.get(key, 5))
+        
+        concerns = result.get("concerns")
+        if not isinstance(concerns, list):
+            result["concerns"] = [concerns] if concerns else []
+        return result
+    
+    @staticmethod
+    def _coerce_score(value: Any) -> float:
+        """Clamp a model-reported 0-10 score to a float"""
+        try:
+            return min(max(float(value), 0.0), 10.0)
+        except (TypeError, ValueError):
+            return 5.0  # Neutral when the model returns prose or null instead of a number
+    
+    async def _cached_completion(self, **params) -> str:
+        """Return a chat completion's text, reusing the on-disk answer for an identical request"""
+        
+        cache_key = hashlib.blake2b(_json_dumps(params), digest_size=16).hexdigest()
+        cached = await asyncio.to_thread(_disk_cache_get, "completion_cache", cache_key, _COMPLETION_CACHE_TTL)
+        if cached is not None:
+            return cached.decode()
+        
+        async with self._get_openai_semaphore():
+            response = await self.openai_client.chat.completions.create(**params)
+        content = response.choices[0].message.content
+        if content:
+            await asyncio.to_thread(_disk_cache_put, "completion_cache", cache_key, content.encode())
+        return content
     
     def deduplicate_and_prioritize_sources(self, sources: List[Dict[str, Any]], query: ResearchQuery) -> List[Dict[str, Any]]:
         """Remove duplicates and prioritize sources by relevance"""
+        signals = self._source_signals(sources)
         
         # Remove duplicates by URL
         seen_urls = set()
         unique_sources = []
         
-        for source in sources:
+        for source, signal in zip(sources, signals):
             url = source.get("url", "")
             if url and url not in seen_urls:
                 seen_urls.add(url)
-                unique_sources.append(source)
+                unique_sources.append((source, signal))
         
-        # Prioritize sources
-        def priority_score(source):
-            score = 0
-            
+        # Prioritize sources: score each one once, then sort on the precomputed score
+        keywords = tuple(keyword.lower() for keyword in query.keywords)
+        scored = []
+        for source, signal in unique_sources:
             # Category priority
-            category_scores = {
-                "investment_data": 10,
-                "industry_reports": 9,
-                "financial_news": 8,
-                "academic": 7,
-                "government": 6,
-                "research_institutes": 5,
-                "general_web": 3
-            }
-            score += category_scores.get(source.get("category", "general_web"), 3)
+            score = _CATEGORY_SCORES.get(source.get("category", "general_web"), 3)
             
             # URL quality indicators
-            url = source.get("url", "").lower()
-            if any(domain in url for domain in ["crunchbase", "bloomberg", "reuters", "wsj"]):
-                score += 5
+            score += signal.priority_bonus
             
             # Title relevance
-            title = source.get("title", "").lower()
-            if any(keyword.lower() in title for keyword in query.keywords):
+            if any(keyword in signal.title_lower for keyword in keywords):
                 score += 3
             
-            return score
+            scored.append((score, source))
         
-        # Sort by priority score
-        unique_sources.sort(key=priority_score, reverse=True)
+        # Sort by priority score; the sort is stable, so ties keep discovery order
+        scored.sort(key=itemgetter(0), reverse=True)
         
-        return unique_sources
+        return [source for _, source in scored]
     
-    async def calculate_comprehensive_quality_score(self, verified_data: List[Dict[str, Any]]) -> float:
+    def calculate_comprehensive_quality_score(self, verified_data: List[Dict[str, Any]]) -> float:
         """Calculate comprehensive data quality score"""
         if not verified_data:
             return 0.0
         
+        if len(verified_data) > _VECTORIZE_QUALITY_ABOVE:
+            return self._vectorized_quality_score(verified_data)
+        
         total_score = 0.0
         scored_items = 0
         
@@ -941,50 +1685,80 @@ class AdvancedFirecrawlClient:
         
         return total_score / scored_items if scored_items > 0 else 0.0
     
+    @staticmethod
+    def _vectorized_quality_score(verified_data: List[Dict[str, Any]]) -> float:
+        """NumPy version of calculate_comprehensive_quality_score for large batches"""
+        import numpy as np
+        
+        n = len(verified_data)
+        base = np.fromiter((data.get("quality_score", 0) for data in verified_data), dtype=np.float64, count=n)
+        
+        # Bonus for AI validation
+        ai_validated = np.fromiter((bool(data.get("ai_validated")) for data in verified_data), dtype=bool, count=n)
+        base = np.where(ai_validated, base * 1.2, base)
+        
+        # Bonus for fact verification
+        verified = np.fromiter((bool(data.get("verification_completed")) for data in verified_data), dtype=bool, count=n)
+        credibility = np.fromiter(
+            (data.get("fact_verification", {}).get("credibility_score", 5) if flag else 5
+             for data, flag in zip(verified_data, verified)),
+            dtype=np.float64, count=n
+        ) / 10.0
+        base = np.where(verified, (base + credibility) / 2, base)
+        
+        return float(np.minimum(base, 1.0).mean())
+    
+    @staticmethod
+    def _source_signals(sources: List[Dict[str, Any]]) -> List[_SourceSignals]:
+        """Derive each source's lowercased title and domain signals in one pass, parallel to sources"""
+        signals = []
+        for source in sources:
+            url = source.get("url", "")
+            domain = _netloc(url)
+            if _TRUSTED_RE.search(domain):
+                adjustment = 0.1
+            elif _QUESTIONABLE_RE.search(domain):
+                adjustment = -0.2
+            else:
+                adjustment = 0.0
+            signals.append(_SourceSignals(
+                title_lower=source.get("title", "").lower(),
+                netloc=domain,
+                priority_bonus=5 if _PRIORITY_DOMAIN_RE.search(url.lower()) else 0,
+                domain_adjustment=adjustment
+            ))
+        return signals
+    
     async def assess_enhanced_source_credibility(self, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Enhanced source credibility assessment"""
+        return self._score_source_credibility(sources)
+    
+    def _score_source_credibility(self, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Synchronous body of assess_enhanced_source_credibility, safe to run in a worker thread"""
+        signals = self._source_signals(sources)
         
         credibility_scores = {}
         category_analysis = {}
         
-        for source in sources:
-            domain = urlparse(source.get("url", "")).netloc
+        # Single pass: score each source once and accumulate its category total inline
+        for source, signal in zip(sources, signals):
+            domain = signal.netloc
             category = source.get("category", "unknown")
             
-            # Enhanced credibility scoring
-            base_scores = {
-                "academic": 0.95,
-                "government": 0.90,
-                "industry_reports": 0.85,
-                "financial_news": 0.80,
-                "research_institutes": 0.85,
-                "investment_data": 0.75,
-                "industry_specific": 0.70,
-                "general_web": 0.50
-            }
-            
-            base_score = base_scores.get(category, 0.50)
+            # Enhanced credibility scoring plus the precomputed domain-specific adjustment
+            base_score = _CREDIBILITY_BASE_SCORES.get(category, 0.50) + signal.domain_adjustment
             
-            # Domain-specific adjustments
-            if any(trusted in domain for trusted in ["bloomberg", "reuters", "wsj", "ft.com"]):
-                base_score += 0.1
-            elif any(questionable in domain for questionable in ["blog", "wordpress", "medium"]):
-                base_score -= 0.2
+            score = min(base_score, 1.0)
+            credibility_scores[domain] = score
             
-            credibility_scores[domain] = min(base_score, 1.0)
-            
-            # Category analysis
-            if category not in category_analysis:
-                category_analysis[category] = {"count": 0, "avg_score": 0}
-            category_analysis[category]["count"] += 1
+            # Category analysis; avg_score holds the running total until the loop ends
+            analysis = category_analysis.setdefault(category, {"count": 0, "avg_score": 0})
+            analysis["count"] += 1
+            analysis["avg_score"] += score
         
         # Calculate category averages
-        for category in category_analysis:
-            category_sources = [s for s in sources if s.get("category") == category]
-            if category_sources:
-                avg_score = sum(credibility_scores.get(urlparse(s.get("url", "")).netloc, 0.5) 
-                              for s in category_sources) / len(category_sources)
-                category_analysis[category]["avg_score"] = avg_score
+        for analysis in category_analysis.values():
+            analysis["avg_score"] /= analysis["count"]
         
         return {
             "source_scores": credibility_scores,
@@ -997,8 +1771,9 @@ class AdvancedFirecrawlClient:
         if not data:
             return False
             
-        # Must have either title or meaningful content
-        has_title = bool(data.get("title", "").strip())
-        has_content = bool(data.get("key_findings") or data.get("data_points") or data.get("investment_data"))
-        
-        return has_title or has_content 
\ No newline at end of file
+        # Must have either title or meaningful content; a real title settles it without
+        # looking at content, and isspace() avoids allocating a stripped copy
+        title = data.get("title")
+        if title and not title.isspace():
+            return True
+        return bool(data.get("key_findings") or data.get("data_points") or data.get("investment_data")) 
\ No newline at end of file
@@ -4,13 +4,12 @@ Enhanced with AI, Advanced Analytics, and Enterprise Features
 """
 
 import os
-import asyncio
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-from main_application import ProfessionalReportGenerator
+from main_application import ProfessionalReportGenerator, configure_logging, run_event_loop
 from enhanced_firecrawl import ResearchQuery
 from advanced_content_generator import ReportConfig, ReportType
 
@@ -116,6 +115,8 @@ async def generate_research_report(query_text: str = None) -> str:
 async def main():
     """Enhanced main function for professional report generation"""
     
+    configure_logging()
+    
     print("🚀 Professional Research Report Generator v2.0")
     print("=" * 50)
     
@@ -170,6 +171,7 @@ async def api_generate_report(query: str) -> dict:
     API-ready function to generate reports
     Returns a dictionary with status and file path
     """
+    configure_logging()
     try:
         output_file = await generate_research_report(query)
         return {
@@ -188,7 +190,7 @@ async def api_generate_report(query: str) -> dict:
 
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    result = run_event_loop(main())
     if result:
         print(f"\n✅ Final output: {result}")
     else:
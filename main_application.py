@@ -1,5 +1,10 @@
 import asyncio
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 from typing import Dict, Any
 from datetime import datetime
 import traceback
@@ -9,6 +14,41 @@ from advanced_content_generator import AdvancedContentGenerator, ReportConfig, R
 from enhanced_data_visualization import EnhancedDataVisualizer
 from professional_pdf_styling import PremiumPDFGenerator, PremiumReportStyling
 
+_log_listener = None
+
+# Modules whose progress lines make up the console output; third-party loggers keep their defaults
+_APP_LOGGERS = ("enhanced_firecrawl", "advanced_content_generator", "enhanced_data_visualization")
+
+def configure_logging(level: int = logging.INFO):
+    """Route the app's log records through a queue to stdout so emitting never blocks"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    # stdout, alongside the print() progress lines these records replaced
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for name in _APP_LOGGERS:
+        app_logger = logging.getLogger(name)
+        app_logger.addHandler(queue_handler)
+        app_logger.setLevel(level)
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    # Flush pending records on interpreter exit
+    atexit.register(_log_listener.stop)
+
+def run_event_loop(main_coro):
+    """Run a coroutine on uvloop when it is installed, otherwise on the default asyncio loop"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main_coro)
+    return uvloop.run(main_coro)
+
 class ProfessionalReportGenerator:
     """Main orchestrator for professional report generation"""
     
@@ -134,35 +174,15 @@ class ProfessionalReportGenerator:
         visualizations = {}
         
         try:
-            # Executive dashboard with real data
-            print("  📊 Creating executive dashboard...")
-            visualizations["executive_dashboard"] = visualizer.create_executive_dashboard(viz_data)
-            
-            # Only create other visualizations if we have relevant data
-            if viz_data.get("trend_data"):
-                print("  📈 Creating trend analysis...")
-                visualizations["trend_analysis"] = visualizer.create_trend_analysis_chart(viz_data["trend_data"])
-            
-            if viz_data.get("quality_metrics"):
-                print("  📊 Creating quality metrics...")
-                visualizations["quality_metrics"] = visualizer.create_quality_metrics_chart(viz_data["quality_metrics"])
-            
-            if viz_data.get("findings_data"):
-                print("  💡 Creating findings summary...")
-                visualizations["findings_summary"] = visualizer.create_findings_summary_chart(viz_data["findings_data"])
-            
-            if viz_data.get("source_analysis"):
-                print("  📊 Creating source distribution...")
-                visualizations["source_distribution"] = visualizer.create_source_distribution_chart(viz_data["source_analysis"])
-            
-            if viz_data.get("competitive_data"):
-                print("  🏢 Creating competitive landscape...")
-                visualizations["competitive_landscape"] = visualizer.create_competitive_landscape_chart(viz_data["competitive_data"])
-                
+            # Charts the data supports are rendered concurrently off the event loop
+            print("  📊 Creating executive dashboard and data-driven charts...")
+            visualizations = await visualizer.generate_all_visualizations_async(viz_data)
         except Exception as e:
             print(f"  ⚠️ Error creating visualizations: {e}")
+        
+        if "executive_dashboard" not in visualizations:
             # Fallback to basic dashboard only
-            visualizations["executive_dashboard"] = visualizer.create_executive_dashboard(viz_data)
+            visualizations["executive_dashboard"] = await asyncio.to_thread(visualizer.create_executive_dashboard, viz_data)
         
         print(f"  📈 Created {len(visualizations)} dynamic visualizations")
         return visualizations
@@ -425,6 +445,8 @@ async def main():
     from dotenv import load_dotenv
     load_dotenv()
     
+    configure_logging()
+    
     # Get API keys
     openai_api_key = os.getenv("OPENAI_API_KEY")
     firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -486,4 +508,4 @@ async def main():
         raise
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_event_loop(main()) 
\ No newline at end of file
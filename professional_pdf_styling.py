@@ -20,6 +20,17 @@ from datetime import datetime
 import os
 import re
 
+# Markdown cleanup patterns used by PremiumPDFGenerator._clean_markdown_content
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_MD_BOLD_STAR_RE = re.compile(r'\*\*(.+?)\*\*')
+_MD_ITALIC_STAR_RE = re.compile(r'\*(.+?)\*')
+_MD_BOLD_UNDERSCORE_RE = re.compile(r'__(.+?)__')
+_MD_ITALIC_UNDERSCORE_RE = re.compile(r'_(.+?)_')
+_MD_BULLET_RE = re.compile(r'^[\s]*[-\*\+]\s+(.+)$', re.MULTILINE)
+_MD_CODE_RE = re.compile(r'`(.+?)`')
+_MD_LINK_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
 class PremiumHeaderFooter:
     """Enhanced premium header and footer system"""
     
@@ -462,23 +473,23 @@ class PremiumPDFGenerator:
             return ""
         
         # Remove markdown headers but preserve structure
-        content = re.sub(r'^#{1,6}\s+(.+)$', r'<b>\1</b>', content, flags=re.MULTILINE)
+        content = _MD_HEADER_RE.sub(r'<b>\1</b>', content)
         
         # Enhanced formatting
-        content = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', content)
-        content = re.sub(r'\*(.+?)\*', r'<i>\1</i>', content)
-        content = re.sub(r'__(.+?)__', r'<b>\1</b>', content)
-        content = re.sub(r'_(.+?)_', r'<i>\1</i>', content)
+        content = _MD_BOLD_STAR_RE.sub(r'<b>\1</b>', content)
+        content = _MD_ITALIC_STAR_RE.sub(r'<i>\1</i>', content)
+        content = _MD_BOLD_UNDERSCORE_RE.sub(r'<b>\1</b>', content)
+        content = _MD_ITALIC_UNDERSCORE_RE.sub(r'<i>\1</i>', content)
         
         # Premium bullet points
-        content = re.sub(r'^[\s]*[-\*\+]\s+(.+)$', r'• \1', content, flags=re.MULTILINE)
+        content = _MD_BULLET_RE.sub(r'• \1', content)
         
         # Clean remaining markdown
-        content = re.sub(r'`(.+?)`', r'<i>\1</i>', content)
-        content = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', content)
+        content = _MD_CODE_RE.sub(r'<i>\1</i>', content)
+        content = _MD_LINK_RE.sub(r'\1', content)
         
         # Remove excessive whitespace
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+        content = _EXCESS_BLANK_LINES_RE.sub('\n\n', content)
         
         return content.strip()
         
@@ -10,6 +10,7 @@ import json
 from datetime import datetime
 from advanced_content_generator import AdvancedContentGenerator, ReportConfig, ReportType
 from professional_pdf_styling import PremiumPDFGenerator, PremiumReportStyling
+from main_application import configure_logging
 
 async def demo_enhanced_research_system():
     """Demonstrate the enhanced research system with mock comprehensive data"""
@@ -290,4 +291,5 @@ async def demo_enhanced_research_system():
         return None
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(demo_enhanced_research_system()) 
\ No newline at end of file
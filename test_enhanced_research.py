@@ -8,7 +8,7 @@ import asyncio
 import os
 import json
 from datetime import datetime
-from main_application import ProfessionalReportGenerator
+from main_application import ProfessionalReportGenerator, configure_logging
 from advanced_content_generator import ReportConfig
 from enhanced_firecrawl import ResearchQuery
 
@@ -128,4 +128,5 @@ async def test_enhanced_research_system():
         return None
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(test_enhanced_research_system()) 
\ No newline at end of file